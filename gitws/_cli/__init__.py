@@ -35,6 +35,7 @@ from .options import (
     depth_option,
     force_option,
     group_filters_option,
+    jobs_option,
     main_path_option,
     manifest_option,
     on_branch_option,
@@ -197,6 +198,7 @@ def clone(
 @click.option("--rebase", is_flag=True, default=False, help="Run 'git rebase' instead of 'git pull'")
 @click.option("--prune", is_flag=True, default=False, help="Remove obsolete git clones")
 @force_option()
+@jobs_option("Update up to JOBS git clones concurrently.")
 @pass_context
 def update(
     context,
@@ -207,6 +209,7 @@ def update(
     rebase: bool = False,
     prune: bool = False,
     force: bool = False,
+    jobs=None,
 ):
     """Create/update all dependent git clones."""
     with exceptionhandling(context):
@@ -217,6 +220,7 @@ def update(
             rebase=rebase,
             prune=prune,
             force=force,
+            jobs=jobs,
         )
 
 
@@ -226,9 +230,12 @@ def update(
 @group_filters_option()
 @reverse_option()
 @on_branch_option()
+@jobs_option("Run on up to JOBS git clones concurrently.")
 @command_option
 @pass_context
-def git(context, command, projects=None, manifest_path=None, group_filters=None, reverse=False, on_branch=False):
+def git(
+    context, command, projects=None, manifest_path=None, group_filters=None, reverse=False, on_branch=False, jobs=None
+):
     """
     Run git COMMAND on projects.
 
@@ -238,7 +245,7 @@ def git(context, command, projects=None, manifest_path=None, group_filters=None,
         command = process_command(command)
         gws = GitWS.from_path(manifest_path=manifest_path, group_filters=group_filters, secho=context.secho)
         filter_ = filter_clone_on_branch if on_branch else None
-        gws.run_foreach(("git", *command), project_paths=projects, reverse=reverse, filter_=filter_)
+        gws.run_foreach(("git", *command), project_paths=projects, reverse=reverse, filter_=filter_, jobs=jobs)
 
 
 @main.command()
@@ -247,8 +254,11 @@ def git(context, command, projects=None, manifest_path=None, group_filters=None,
 @group_filters_option()
 @command_options_option
 @unshallow_option()
+@jobs_option("Run on up to JOBS git clones concurrently.")
 @pass_context
-def fetch(context, command_options=None, projects=None, manifest_path=None, group_filters=None, unshallow=False):
+def fetch(
+    context, command_options=None, projects=None, manifest_path=None, group_filters=None, unshallow=False, jobs=None
+):
     """
     Run 'git fetch' on projects.
 
@@ -260,7 +270,7 @@ def fetch(context, command_options=None, projects=None, manifest_path=None, grou
         base_cmd = ("git", "fetch")
         if unshallow:
             base_cmd = (*base_cmd, "--unshallow")
-        gws.run_foreach(base_cmd + command_options, project_paths=projects)
+        gws.run_foreach(base_cmd + command_options, project_paths=projects, jobs=jobs)
 
 
 @main.command()
@@ -268,8 +278,9 @@ def fetch(context, command_options=None, projects=None, manifest_path=None, grou
 @manifest_option()
 @group_filters_option()
 @command_options_option
+@jobs_option("Run on up to JOBS git clones concurrently.")
 @pass_context
-def pull(context, command_options=None, projects=None, manifest_path=None, group_filters=None):
+def pull(context, command_options=None, projects=None, manifest_path=None, group_filters=None, jobs=None):
     """
     Run 'git pull' on projects.
 
@@ -278,7 +289,9 @@ def pull(context, command_options=None, projects=None, manifest_path=None, group
     with exceptionhandling(context):
         command_options = process_command_options(command_options)
         gws = GitWS.from_path(manifest_path=manifest_path, group_filters=group_filters, secho=context.secho)
-        gws.run_foreach(("git", "pull", *command_options), project_paths=projects, filter_=filter_clone_on_branch)
+        gws.run_foreach(
+            ("git", "pull", *command_options), project_paths=projects, filter_=filter_clone_on_branch, jobs=jobs
+        )
 
 
 @main.command()
@@ -472,9 +485,12 @@ def tag(context, name, manifest_path=None, group_filters=None, message=None, for
 @group_filters_option()
 @reverse_option()
 @on_branch_option()
+@jobs_option("Run on up to JOBS git clones concurrently.")
 @command_option
 @pass_context
-def foreach(context, command, projects=None, manifest_path=None, group_filters=None, reverse=False, on_branch=False):
+def foreach(
+    context, command, projects=None, manifest_path=None, group_filters=None, reverse=False, on_branch=False, jobs=None
+):
     """
     Run COMMAND on projects.
 
@@ -485,7 +501,7 @@ def foreach(context, command, projects=None, manifest_path=None, group_filters=N
         command = process_command(command)
         gws = GitWS.from_path(manifest_path=manifest_path, group_filters=group_filters, secho=context.secho)
         filter_ = filter_clone_on_branch if on_branch else None
-        gws.run_foreach(command, project_paths=projects, reverse=reverse, filter_=filter_)
+        gws.run_foreach(command, project_paths=projects, reverse=reverse, filter_=filter_, jobs=jobs)
 
 
 @main.command()
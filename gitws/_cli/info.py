@@ -17,10 +17,8 @@
 """Info Commands."""
 
 import click
-from anytree import ContStyle, RenderTree
 
 from gitws import GitWS
-from gitws._deptree import DepDotExporter
 from gitws.exceptions import NoMainError
 
 from .common import exceptionhandling, pass_context
@@ -107,6 +105,10 @@ def dep_tree(context, manifest_path=None, group_filters=None, dot: bool = False,
 
     $ git ws info dep-tree --dot | dot -Tsvg > dep-tree.svg
     """  # noqa: D412
+    from anytree import ContStyle, RenderTree  # pylint: disable=import-outside-toplevel
+
+    from gitws._deptree import DepDotExporter  # pylint: disable=import-outside-toplevel
+
     with exceptionhandling(context):
         gws = GitWS.from_path(manifest_path=manifest_path, group_filters=group_filters)
         deptree = gws.get_deptree(primary=primary)
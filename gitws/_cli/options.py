@@ -131,6 +131,11 @@ def depth_option():
     return click.option("--depth", type=int, help="Create clones shallow of that depth.")
 
 
+def jobs_option(help_: str):
+    """Return Jobs Option."""
+    return click.option("--jobs", "-j", type=click.IntRange(min=1), help=help_)
+
+
 def process_main_path(value) -> Optional[Path]:
     """Process ``path_option``."""
     if value:
@@ -22,8 +22,9 @@ The creation/cloning of missing project dependencies during the iteration is sup
 """
 import logging
 from fnmatch import fnmatchcase
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Iterator, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from ._manifestformatmanager import ManifestFormatManager
 from ._util import resolve_relative
@@ -178,6 +179,29 @@ class ProjectIter:
         self.__done: List[str] = []
 
     def __iter__(self) -> Iterator[Project]:
+        return (project for project in self.__iter_projects() if project)
+
+    def batches(self) -> Iterator[Tuple[Project, ...]]:
+        """
+        Iterate over batches of :py:class:`gitws.Project` s.
+
+        The projects of one batch do not depend on each other. Their manifest files are read after the
+        entire batch has been consumed. So all projects of one batch can be updated concurrently,
+        before the next batch is requested.
+
+        Yields:
+            Tuple of :py:class:`gitws.Project` s.
+        """
+        batch: List[Project] = []
+        for project in self.__iter_projects():
+            if project:
+                batch.append(project)
+            elif batch:
+                yield tuple(batch)
+                batch = []
+
+    def __iter_projects(self) -> Iterator[Optional[Project]]:
+        """Iterate over all projects - ``None`` marks the end of every batch."""
         workspace = self.workspace
         info = workspace.info
         main_path_rel = str(info.main_path or "")
@@ -193,6 +217,7 @@ class ProjectIter:
                 revision=revision,
                 is_main=True,
             )
+            yield None
         try:
             manifest_spec = self.manifest_format_manager.load(self.manifest_path)
         except ManifestNotFoundError:
@@ -205,8 +230,8 @@ class ProjectIter:
 
     def __iter(
         self, level: int, project_path: Optional[Path], manifest_spec: ManifestSpec, filter_: FilterFunc
-    ) -> Iterator[Project]:
-        deps: List[Tuple[Path, ManifestSpec, GroupSelects]] = []
+    ) -> Iterator[Optional[Project]]:
+        recursive: List[Project] = []
         refurl: Optional[str] = None
         done: List[str] = self.__done
         if project_path and manifest_spec.dependencies:
@@ -234,10 +259,22 @@ class ProjectIter:
             _LOGGER.debug("%r", dep_project)
             yield dep_project
 
-            if not dep_project.recursive:
-                continue
+            if dep_project.recursive:
+                recursive.append(dep_project)
 
-            # Recursive
+        # The manifests are read after the entire batch, as the consumer might update the projects in between
+        yield None
+
+        # We resolve all dependencies in a second iteration to prioritize the manifest
+        sublevel = level + 1
+        for dep_project_path, dep_manifest, dep_group_selects in self.__load_manifests(recursive):
+            dep_filter = create_filter(dep_group_selects)
+            yield from self.__iter(sublevel, dep_project_path, dep_manifest, dep_filter)
+
+    def __load_manifests(self, projects: List[Project]) -> List[Tuple[Path, ManifestSpec, GroupSelects]]:
+        """Load Manifests of ``projects`` - if they have one."""
+        deps: List[Tuple[Path, ManifestSpec, GroupSelects]] = []
+        for dep_project in projects:
             dep_project_path = self.workspace.get_project_path(dep_project)
             dep_manifest_path = dep_project_path / (find_manifest(dep_project_path) or dep_project.manifest_path)
             try:
@@ -247,12 +284,7 @@ class ProjectIter:
             else:
                 group_selects = group_selects_from_groups(dep_project.with_groups)
                 deps.append((dep_project_path, dep_manifest, group_selects))
-
-        # We resolve all dependencies in a second iteration to prioritize the manifest
-        sublevel = level + 1
-        for dep_project_path, dep_manifest, dep_group_selects in deps:
-            dep_filter = create_filter(dep_group_selects)
-            yield from self.__iter(sublevel, dep_project_path, dep_manifest, dep_filter)
+        return deps
 
 
 def create_filter(group_selects: GroupSelects, default: bool = False) -> FilterFunc:
@@ -315,27 +347,25 @@ def create_filter(group_selects: GroupSelects, default: bool = False) -> FilterF
     False
     >>> groupfilter('special', ('test', 'bar'))  # deselected, but overwritten by '+test'
     True
+
+    Filters are shared for identical ``group_selects`` and their results are memoized,
+    as many projects share the same groups.
     """
+    return _create_filter(tuple(group_selects), default)
+
+
+@lru_cache(maxsize=32)
+def _create_filter(group_selects: GroupSelects, default: bool) -> FilterFunc:
     if group_selects:
+        # projects are filtered repeatedly by the same path and groups
+        cache: Dict[Tuple[str, Groups], bool] = {}
 
         def filter_(path: str, groups: Groups):
-            if groups:
-                selects = {group: default for group in groups}
-            else:
-                selects = {"": True}
-            for group_select in group_selects:
-                group = group_select.group
-                if group and group not in selects:
-                    # not relevant group name
-                    continue
-                if group_select.path and not fnmatchcase(path, group_select.path):
-                    # not relevant path
-                    continue
-                if group:
-                    selects[group] = group_select.select
-                else:
-                    selects = {group: group_select.select for group in selects}
-            return any(selects.values())
+            key = (path, groups)
+            selected = cache.get(key)
+            if selected is None:
+                selected = cache[key] = _is_selected(group_selects, default, path, groups)
+            return selected
 
     else:
 
@@ -345,3 +375,23 @@ def create_filter(group_selects: GroupSelects, default: bool = False) -> FilterF
             return True
 
     return filter_
+
+
+def _is_selected(group_selects: GroupSelects, default: bool, path: str, groups: Groups) -> bool:
+    if groups:
+        selects = {group: default for group in groups}
+    else:
+        selects = {"": True}
+    for group_select in group_selects:
+        group = group_select.group
+        if group and group not in selects:
+            # not relevant group name
+            continue
+        if group_select.path and not fnmatchcase(path, group_select.path):
+            # not relevant path
+            continue
+        if group:
+            selects[group] = group_select.select
+        else:
+            selects = {group: group_select.select for group in selects}
+    return any(selects.values())
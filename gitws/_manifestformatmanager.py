@@ -17,10 +17,12 @@
 """
 Manifest format_ Manager.
 """
+import os
 import sys
+import time
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from pydantic import ConfigDict, PrivateAttr
 
@@ -34,6 +36,10 @@ if sys.version_info < (3, 10):  # pragma: no cover
 else:
     from importlib.metadata import entry_points
 
+# Files modified within this time frame are not cached, as a rewrite within the file system
+# timestamp granularity might keep modification time and size.
+_RACY_NS = 2_000_000_000
+
 
 class Handler(BaseModel):
     """format_ Handler."""
@@ -74,10 +80,12 @@ class ManifestFormatManager(BaseModel):
     """
 
     _manifest_formats: List[ManifestFormat] = PrivateAttr(default_factory=list)
+    _cache: Dict[str, Tuple[Tuple[int, int, int], ManifestSpec]] = PrivateAttr(default_factory=dict)
 
     def add(self, manifestformat: ManifestFormat):
         """Register Manifest format_."""
         self._manifest_formats.append(manifestformat)
+        self._cache.clear()
 
     @property
     def manifest_formats(self) -> Tuple[ManifestFormat, ...]:
@@ -110,13 +118,31 @@ class ManifestFormatManager(BaseModel):
         """
         Load Manifest From ``path``.
 
+        The manifest is cached, as long as the file stays unchanged.
+
         Raises:
             ManifestNotFoundError: if file is not found
             IncompatibleFormatError: Not Supported File format_.
             ManifestError: On Syntax Or Data Scheme Errors.
         """
+        key = os.path.abspath(path)
+        stamp = _get_stamp(key)
+        cached = self._cache.get(key)
+        if stamp and cached and cached[0] == stamp:
+            return cached[1]
         with self.handle(path) as fmt:
-            return fmt.load()
+            spec = fmt.load()
+        if stamp and (time.time_ns() - stamp[1]) > _RACY_NS:
+            self._cache[key] = (stamp, spec)
+        return spec
+
+
+def _get_stamp(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
 
 _MANAGER: Optional[ManifestFormatManager] = None
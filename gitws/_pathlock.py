@@ -21,11 +21,16 @@ from datetime import timedelta
 from os import rename
 from pathlib import Path
 from shutil import copyfile, copytree, rmtree
+from threading import Lock as ThreadLock
 from threading import Semaphore, Thread
+from typing import Dict
 from uuid import uuid4
 
 from flufl.lock import Lock
 
+_THREAD_LOCKS: Dict[str, ThreadLock] = {}
+_THREAD_LOCKS_LOCK = ThreadLock()
+
 
 @contextmanager
 def path_lock(path: Path):
@@ -54,8 +59,7 @@ def path_lock(path: Path):
     refreshes the lock. That also means that - in case a process dies - the
     lock will eventually expire and a new process can continue.
 
-    Also note that this function must not be used on the same path
-    simultaneously in the same process.
+    Threads of the same process, which lock the same path, wait for each other.
     """
     # Set up the lock. We construct it by appending a suffix to the path to be
     # locked, which should make it unlikely that this is used as something else:
@@ -64,26 +68,28 @@ def path_lock(path: Path):
     lock_file_folder_path.mkdir(parents=True, exist_ok=True)
     lock = Lock(str(lock_file_path), lifetime=timedelta(seconds=5))
 
-    # Try to acquire the lock
-    lock.lock()
-
-    try:
-        # Set up a thread that runs in parallel and regularly refreshes the
-        # lock:
-        semaphore = Semaphore()
-        semaphore.acquire()
-        thread = Thread(target=_keep_lock, args=[lock, semaphore])
-        thread.start()
+    # The lock file is owned by the process, threads of this process wait for each other upfront:
+    with _get_thread_lock(lock_file_path):
+        # Try to acquire the lock
+        lock.lock()
 
-        # Give control to the caller:
-        yield
-    finally:
-        # Yield the semaphore, so the background thread terminates:
-        semaphore.release()
-        thread.join()
+        try:
+            # Set up a thread that runs in parallel and regularly refreshes the
+            # lock:
+            semaphore = Semaphore()
+            semaphore.acquire()
+            thread = Thread(target=_keep_lock, args=[lock, semaphore])
+            thread.start()
+
+            # Give control to the caller:
+            yield
+        finally:
+            # Yield the semaphore, so the background thread terminates:
+            semaphore.release()
+            thread.join()
 
-        # Release the lock:
-        lock.unlock()
+            # Release the lock:
+            lock.unlock()
 
 
 @contextmanager
@@ -159,6 +165,12 @@ def atomic_update_or_create_path(path: Path):
                     tmp_path.unlink()
 
 
+def _get_thread_lock(path: Path) -> ThreadLock:
+    """Return the one lock, which serializes all threads locking ``path``."""
+    with _THREAD_LOCKS_LOCK:
+        return _THREAD_LOCKS.setdefault(str(path), ThreadLock())
+
+
 def _keep_lock(lock: Lock, semaphore: Semaphore):
     """
     Keep a file lock alive.
@@ -17,11 +17,13 @@
 """Utilities."""
 import logging
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Generator, Optional
 
 import tomlkit
 
@@ -29,24 +31,116 @@ LOGGER = logging.getLogger("git-ws")
 # Dependencies to any gitws module are forbidden here!
 
 
-def run(cmd, cwd=None, capture_output=False, check=True, secho=None):
-    """Simplified wrapper around :any:`subprocess.run`."""
-    cwdrelstr = str(resolve_relative(cwd)) if cwd else None
+def run(cmd, cwd=None, capture_output=False, check=True, secho=None, echo_stdout=False):
+    """
+    Simplified wrapper around :any:`subprocess.run`.
+
+    ``echo_stdout`` reports the standard output via ``secho`` too, instead of passing it through.
+    """
+    cwdrelstr = _get_cwdrelstr(cwd)
     # format errors in red
     stderr = None if capture_output or not secho else subprocess.PIPE
+    stdout = subprocess.PIPE if stderr and echo_stdout else None
     try:
-        result = subprocess.run(cmd, capture_output=capture_output, stderr=stderr, check=check, cwd=cwd)
+        result = subprocess.run(cmd, capture_output=capture_output, stdout=stdout, stderr=stderr, check=check, cwd=cwd)
         LOGGER.debug("run(%r, cwd=%r) OK stdout=%r stderr=%r", cmd, cwdrelstr, result.stdout, result.stderr)
+        if stdout and result.stdout:
+            secho(result.stdout.decode("utf-8", errors="replace").rstrip())
         if stderr and result.stderr:
             secho(result.stderr.decode("utf-8").rstrip())
         return result
     except subprocess.CalledProcessError as error:
         LOGGER.debug("run(%r, cwd=%r) FAILED stdout=%r stderr=%r", cmd, cwdrelstr, error.stdout, error.stderr)
+        if stdout and error.stdout:
+            secho(error.stdout.decode("utf-8", errors="replace").rstrip())
         if stderr and error.stderr:
             secho(error.stderr.decode("utf-8").rstrip(), fg="red", err=True)
         raise error
 
 
+def run_stream(cmd, cwd=None, sep=b"\0", bufsize=65536) -> Generator[bytes, None, None]:
+    """
+    Run ``cmd`` and yield its ``sep`` separated standard output while it is running.
+
+    Records are yielded as raw bytes - decoding is left to the caller.
+
+    ``cmd`` is terminated, if the iteration is stopped early (i.e. the generator is closed).
+
+    Raises:
+        subprocess.CalledProcessError: on a non-zero exit code, after all output has been yielded.
+    """
+    cwdrelstr = _get_cwdrelstr(cwd)
+    # stderr goes to a temporary file - a pipe, which is just read after stdout, could fill up and block ``cmd``
+    with tempfile.TemporaryFile() as errfile:
+        with subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=errfile) as proc:
+            assert proc.stdout
+            try:
+                rest = b""
+                while True:
+                    chunk = os.read(proc.stdout.fileno(), bufsize)
+                    if not chunk:
+                        break
+                    *records, rest = (rest + chunk).split(sep)
+                    yield from records
+                if rest:
+                    yield rest
+            except GeneratorExit:
+                # Nobody is interested in the remaining output
+                proc.terminate()
+                LOGGER.debug("run_stream(%r, cwd=%r) TERMINATED", cmd, cwdrelstr)
+                raise
+            returncode = proc.wait()
+        errfile.seek(0)
+        stderr = errfile.read()
+    if returncode:
+        LOGGER.debug("run_stream(%r, cwd=%r) FAILED stderr=%r", cmd, cwdrelstr, stderr)
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+    LOGGER.debug("run_stream(%r, cwd=%r) OK stderr=%r", cmd, cwdrelstr, stderr)
+
+
+def _get_cwdrelstr(cwd) -> Optional[str]:
+    """Relative ``cwd`` for debug logging - resolving paths costs filesystem calls, so just if needed."""
+    if cwd and LOGGER.isEnabledFor(logging.DEBUG):
+        return str(resolve_relative(cwd))
+    return None
+
+
+def get_max_workers(count: int) -> int:
+    """Thread pool size for ``count`` concurrent ``git`` calls, which are all bound to subprocesses, not the CPU."""
+    return max(1, min(32, (os.cpu_count() or 1) * 4, count))
+
+
+def is_empty_or_missing(path: Path) -> bool:
+    """
+    Return ``True`` if directory ``path`` is empty or does not exist.
+
+    Just the first directory entry is read.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is None
+    except FileNotFoundError:
+        return True
+
+
+def rmtree(path: Path):
+    """
+    Remove directory ``path`` recursively and ignore any errors.
+
+    On POSIX a single ``rm -rf`` walks and unlinks the tree natively, which is much faster than
+    :any:`shutil.rmtree` on clones with many loose objects. :any:`shutil.rmtree` is the fallback.
+    """
+    if os.name == "posix":
+        try:
+            result = subprocess.run(("rm", "-rf", "--", str(path)), capture_output=True, check=False)
+        except FileNotFoundError:  # pragma: no cover
+            pass
+        else:
+            if not result.returncode:
+                return
+    shutil.rmtree(path, ignore_errors=True)  # pragma: no cover
+
+
 def no_echo(text: str, err=False, **kwargs):
     """Just suppress ``text``."""
     if err:
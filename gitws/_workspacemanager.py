@@ -19,13 +19,14 @@
 Workspace Management.
 """
 import hashlib
-import shutil
+import os
+from concurrent.futures import ThreadPoolExecutor
 from os import readlink
 from pathlib import Path
 from shutil import copy2
 from typing import Any, Dict, Iterator, List, Optional
 
-from ._util import exception2logging, no_echo, relative
+from ._util import exception2logging, get_max_workers, no_echo, relative, rmtree
 from .const import COLOR_ACTION, COLOR_BANNER, GIT_WS_PATH
 from .datamodel import FileRefs, WorkspaceFileRef, WorkspaceFileRefs
 from .exceptions import FileRefConflict, FileRefModifiedError, GitCloneNotCleanError, OutsideWorkspaceError
@@ -118,15 +119,31 @@ class WorkspaceManager:
 
     def prune(self, force: bool = False):
         """Remove obsolete stuff."""
-        for obsolete_path in self._iter_obsoletes():
-            rel_path = relative(obsolete_path)
-            self.secho(f"===== {rel_path} (OBSOLETE) =====", fg=COLOR_BANNER)
-            self.secho(f"Removing {str(rel_path)!r}.", fg=COLOR_ACTION)
-            git = Git(obsolete_path, secho=self.secho)
-            if force or not git.is_cloned() or git.is_empty():
-                shutil.rmtree(obsolete_path, ignore_errors=True)
+        obsolete_paths = tuple(self._iter_obsoletes())
+        # probe all clones concurrently upfront, report in order and remove concurrently
+        with ThreadPoolExecutor(max_workers=get_max_workers(len(obsolete_paths))) as executor:
+            if force:
+                removables = [True] * len(obsolete_paths)
             else:
-                raise GitCloneNotCleanError(relative(rel_path))
+                removables = list(executor.map(self._is_removable, obsolete_paths))
+            removals = []
+            for obsolete_path, removable in zip(obsolete_paths, removables):
+                rel_path = relative(obsolete_path)
+                self.secho(f"===== {rel_path} (OBSOLETE) =====", fg=COLOR_BANNER)
+                self.secho(f"Removing {str(rel_path)!r}.", fg=COLOR_ACTION)
+                if not removable:
+                    # the preceding removals are finished on leaving the executor
+                    raise GitCloneNotCleanError(relative(rel_path))
+                removals.append(executor.submit(rmtree, obsolete_path))
+            for removal in removals:
+                removal.result()
+
+    def _is_removable(self, path: Path) -> bool:
+        if not os.path.lexists(path / ".git"):
+            # not a git clone - no need to ask git
+            return True
+        git = Git(path, secho=self.secho)
+        return not git.is_cloned() or git.is_empty()
 
     def _rm_obsolete(self, existing: WorkspaceFileRefs, force: bool):
         filerefmap = self._filerefmap
@@ -249,13 +266,16 @@ class WorkspaceManager:
         yield from self.__iter_obsoletes(self.workspace.path, usemap)
 
     def __iter_obsoletes(self, path, usemap):
-        for sub in sorted(path.iterdir()):
-            if sub.name in usemap:
-                subusemap = usemap[sub.name]
+        # os.scandir() provides the entry type without an extra stat() per entry
+        with os.scandir(path) as scan:
+            entries = sorted(scan, key=lambda entry: entry.name)
+        for entry in entries:
+            if entry.name in usemap:
+                subusemap = usemap[entry.name]
                 if subusemap:
-                    yield from self.__iter_obsoletes(sub, subusemap)
-            elif sub.is_dir():
-                yield sub
+                    yield from self.__iter_obsoletes(path / entry.name, subusemap)
+            elif entry.is_dir():
+                yield path / entry.name
 
 
 def _get_filehash(path: Path):
@@ -28,7 +28,7 @@ from contextlib import contextmanager
 from enum import Enum
 from os import environ
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import tomlkit
 import tomlkit.exceptions
@@ -300,6 +300,7 @@ class AppConfig:
 
         # Clear the cached merged config so we'll reload it on next access
         self._merged_config = None
+        clear_clone_cache()
 
     @contextmanager
     def edit(self, location: AppConfigLocation) -> Iterator[AppConfigData]:
@@ -377,9 +378,58 @@ class AppConfig:
             raise UninitializedError()
         raise InvalidConfigurationLocationError(str(location))
 
+    def get_stamp(self) -> Tuple[Tuple[str, int, int, int], ...]:
+        """
+        Identify the state of all configuration files by path, inode, modification time and size.
+
+        The stamp changes whenever a configuration file is created, modified or removed.
+        """
+        paths = [Path(self._system_config_dir) / CONFIG_FILE_NAME, Path(self._user_config_dir) / CONFIG_FILE_NAME]
+        if self._workspace_config_dir is not None:
+            paths.append(Path(self._workspace_config_dir) / CONFIG_FILE_NAME)
+        return tuple(_get_filestamp(path) for path in paths)
+
     @staticmethod
     def _fill_in_defaults(config: AppConfigData):
         """Fill in some sensible defaults in the given config object."""
         for name, default in AppConfigData.defaults().items():
             if getattr(config, name) is None:
                 setattr(config, name, default)
+
+
+def get_clone_cache() -> Optional[Path]:
+    """
+    Return the ``clone_cache`` option of the default :any:`AppConfig`.
+
+    The value is reused as long as the configuration files and the ``GIT_WS_*`` environment are unchanged,
+    instead of loading and merging all configuration files for every single clone.
+    """
+    app_config = AppConfig()
+    env = tuple(sorted((name, value) for name, value in environ.items() if name.upper().startswith("GIT_WS_")))
+    key = (env, app_config.get_stamp())
+    try:
+        return _CLONE_CACHE[key]
+    except KeyError:
+        pass
+    clone_cache = app_config.options.clone_cache
+    # just the latest value is of interest
+    _CLONE_CACHE.clear()
+    _CLONE_CACHE[key] = clone_cache
+    return clone_cache
+
+
+def clear_clone_cache():
+    """Discard the value cached by :any:`get_clone_cache`."""
+    _CLONE_CACHE.clear()
+
+
+_CLONE_CACHE: Dict[Any, Optional[Path]] = {}
+
+
+def _get_filestamp(path: Path) -> Tuple[str, int, int, int]:
+    """Path, inode, modification time and size of ``path`` - or zeros if missing."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return (str(path), 0, 0, 0)
+    return (str(path), stat.st_ino, stat.st_mtime_ns, stat.st_size)
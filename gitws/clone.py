@@ -22,11 +22,12 @@ A :any:`Clone` is just the assembly of a :any:`Project` and its corresponding gi
 
 import logging
 from contextlib import suppress
+from functools import cached_property
 from pathlib import Path
 from typing import Callable, Iterator, List, Optional, Tuple
 
 from ._util import get_repr
-from .appconfig import AppConfig
+from .appconfig import get_clone_cache
 from .datamodel import Project
 from .git import Git
 from .workspace import Workspace
@@ -48,11 +49,11 @@ class Clone:
         self.git = git
 
     @staticmethod
-    def from_project(workspace: Workspace, project: Project, secho=None) -> "Clone":
+    def from_project(workspace: Workspace, project: Project, secho=None, echo_stdout: bool = False) -> "Clone":
         """Create :any:`Clone` for ``project`` in ``workspace``."""
         project_path = workspace.get_project_path(project, relative=True)
-        clone_cache = AppConfig().options.clone_cache
-        git = Git(project_path, clone_cache=clone_cache, secho=secho)
+        clone_cache = get_clone_cache()
+        git = Git(project_path, clone_cache=clone_cache, secho=secho, echo_stdout=echo_stdout)
         return Clone(project, git)
 
     def check(self, exists=True, diff=True):
@@ -102,8 +103,7 @@ class Clone:
             if branch:
                 revs = (branch,)
             else:
-                tag = git.get_tag()
-                sha = git.get_sha()
+                tag, _, sha = git.describe_head()
                 if tag and sha:
                     revs = (tag, sha)
                 elif tag:
@@ -122,11 +122,13 @@ class Clone:
     def __repr__(self):
         return get_repr(self, (self.project, self.git))
 
-    @property
+    @cached_property
     def info(self):
         """
         `repr`-like info string but more condensed.
 
+        Computed once, as it is printed on every banner.
+
         >>> import gitws
         >>> project = gitws.Project(name='pname', level=0, path='ppath', revision='prevision')
         >>> git = gitws.Git('gpath')
@@ -31,6 +31,7 @@ Central :any:`GitWS` Datamodel.
 
 
 import re
+from functools import lru_cache
 from pathlib import Path, PurePath
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -208,6 +209,12 @@ def group_selects_from_groups(groups: Groups) -> GroupSelects:
 
 def group_selects_from_filters(group_filters: GroupFilters) -> GroupSelects:
     """Create :any:`GroupSelects` from `GroupFilters`."""
+    return _group_selects_from_filters(tuple(group_filters))
+
+
+@lru_cache(maxsize=32)
+def _group_selects_from_filters(group_filters: GroupFilters) -> GroupSelects:
+    # The same filters are parsed on every manifest iteration - parse them once.
     return tuple(GroupSelect.from_group_filter(group_filter) for group_filter in group_filters)
 
 
@@ -828,6 +835,27 @@ class AppConfigData(BaseSettings):
     0 deactivates shallow cloning.
     """
 
+    clone_filter: Optional[str] = Field(default=None, description="Partial Clone Filter for New Clones")
+    """
+    Partial Clone Filter.
+
+    New clones are created as partial clones with the given filter (i.e. ``blob:none``),
+    which defers downloading file contents until they are needed.
+    Clones from the clone cache are not filtered.
+
+    This option can be overridden by specifying the ``GIT_WS_CLONE_FILTER`` environment variable.
+    """
+
+    jobs: Optional[int] = Field(default=None, description="Number of Git Clones Updated Concurrently")
+    """
+    Concurrent Updates.
+
+    ``git ws update`` fetches, clones and merges up to ``jobs`` git clones at the same time.
+    The output is reported in order. One after another by default.
+
+    This option can be overridden by specifying the ``GIT_WS_JOBS`` environment variable.
+    """
+
     @staticmethod
     def defaults() -> Dict[str, Any]:
         """
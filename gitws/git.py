@@ -29,26 +29,30 @@ import os
 import re
 import shutil
 import subprocess
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, suppress
 from enum import Enum
 from pathlib import Path
-from typing import Iterator, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union
 
 from ._basemodel import BaseModel
-from ._pathlock import atomic_update_or_create_path
+from ._pathlock import atomic_update_or_create_path, path_lock
 from ._url import strip_user_password
-from ._util import get_repr, no_echo, run
-from .appconfig import AppConfig
+from ._util import get_max_workers, get_repr, is_empty_or_missing, no_echo, run, run_stream
+from .appconfig import get_clone_cache
 from .exceptions import GitCloneMissingError, NoGitError
 
-_RE_URL = re.compile(r"\Aorigin\s+(?P<value>.+)\s+\(fetch\)\Z")
 _RE_BRANCH = re.compile(r"\A\*\s(?P<value>\S+)\Z")
-_RE_STATUS = re.compile(r"\A(?P<index>.)(?P<work>.)\s((?P<orig_path>.+) -> )?(?P<path>.+)\Z")
-_RE_DIFFSTAT = re.compile(r"\A\s(?P<path>.+)\s\|\s(?P<stat>.+)\Z")
+_RE_SHA = re.compile(r"\A[0-9a-fA-F]{7,40}\Z")
+_RE_FULL_SHA = re.compile(r"\A[0-9a-f]{40}(?:[0-9a-f]{24})?\Z")
 _LOGGER = logging.getLogger("git-ws")
 
 Args = Union[List[str], Tuple[str, ...]]
 BoolOptions = Tuple[Tuple[str, bool], ...]
 Paths = Tuple[Path, ...]
+Stamp = Tuple[Tuple[str, int, int, int], ...]
 
 
 class State(Enum):
@@ -72,10 +76,18 @@ class State(Enum):
     COPIED = "C"
     UPDATED_UNMERGED = "U"
 
-    def __str__(self):
+    def __str__(self) -> str:
         return self.value
 
 
+_STATE_BY_CHAR: Dict[str, State] = {state.value: state for state in State}
+_STATE_BY_BYTE: Dict[int, State] = {ord(state.value): state for state in State}
+_CHANGED_STATES = frozenset(State) - {State.UNMODIFIED, State.IGNORED, State.UNTRACKED}
+_PREFIX_BY_STATES: Dict[Tuple[State, State], str] = {
+    (index, work): f"{index.value}{work.value} " for index in State for work in State
+}
+
+
 class Status(BaseModel):
     """Status (One ``git status`` line)."""
 
@@ -129,34 +141,60 @@ class FileStatus(Status):
     orig_path: Optional[Path] = None
     """File Path of the original file in case of a move."""
 
-    def __str__(self):
+    def __str__(self) -> str:
+        prefix = _PREFIX_BY_STATES[(self.index, self.work)]
         if self.orig_path:
-            return f"{self.index}{self.work} {self.orig_path!s} -> {self.path!s}"
-        return f"{self.index}{self.work} {self.path!s}"
+            return f"{prefix}{self.orig_path} -> {self.path}"
+        return f"{prefix}{self.path}"
 
     @staticmethod
-    def from_str(line) -> "FileStatus":
+    def from_str(line: str) -> "FileStatus":
         """Create from ``git status --porcelain`` Output."""
-        mat = _RE_STATUS.match(line)
-        assert mat, f"Invalid pattern {line}"
-        return FileStatus(**mat.groupdict())
+        assert line[2:3].isspace() and line[3:], f"Invalid pattern {line}"
+        orig_path, sep, path = line[3:].rpartition(" -> ")
+        # fields are well-formed by construction - skip validation
+        return FileStatus.model_construct(
+            index=_STATE_BY_CHAR[line[0]],
+            work=_STATE_BY_CHAR[line[1]],
+            path=Path(path),
+            orig_path=Path(orig_path) if sep else None,
+        )
+
+    @staticmethod
+    def from_record(record: bytes, orig_path: Optional[bytes] = None) -> "FileStatus":
+        """
+        Create from ``git status --porcelain -z`` Output.
+
+        >>> FileStatus.from_record(b"R  dest", orig_path=b"src")
+        FileStatus(index=<State.RENAMED: 'R'>, work=<State.UNMODIFIED: ' '>, path=PosixPath('dest'), orig_path=...
+        """
+        return FileStatus.model_construct(
+            index=_STATE_BY_BYTE[record[0]],
+            work=_STATE_BY_BYTE[record[1]],
+            path=Path(record[3:].decode("utf-8")),
+            orig_path=Path(orig_path.decode("utf-8")) if orig_path is not None else None,
+        )
 
     def with_path(self, path: Path) -> "FileStatus":
         """Return :any:`FileStatus` with ``path`` as prefix."""
-        update = {
-            "path": path / self.path,
-        }
-        if self.orig_path:
-            update["orig_path"] = path / self.orig_path
-        return self.model_copy(update=update)
+        return FileStatus.model_construct(
+            index=self.index,
+            work=self.work,
+            path=path / self.path,
+            orig_path=path / self.orig_path if self.orig_path else None,
+        )
 
     def has_work_changes(self) -> bool:
         """Has Work Changes."""
-        return self.work not in (State.UNMODIFIED, State.IGNORED, State.UNTRACKED)
+        return self.work in _CHANGED_STATES
 
     def has_index_changes(self) -> bool:
         """Has Index Changes."""
-        return self.index not in (State.UNMODIFIED, State.IGNORED, State.UNTRACKED)
+        return self.index in _CHANGED_STATES
+
+    def has_changes(self) -> bool:
+        """Has Changes."""
+        return self.index in _CHANGED_STATES or self.work in _CHANGED_STATES
 
 
 class BranchStatus(Status):
@@ -173,13 +211,13 @@ class BranchStatus(Status):
     info: str
     """Branch Status String."""
 
-    def __str__(self):
+    def __str__(self) -> str:
         return self.info
 
     @staticmethod
-    def from_str(line) -> "BranchStatus":
+    def from_str(line: str) -> "BranchStatus":
         """Create from ``git status --porcelain`` Output."""
-        return BranchStatus(info=line)
+        return BranchStatus.model_construct(info=line)
 
     def with_path(self, path: Path) -> "BranchStatus":
         """Return :any:`BranchStatus` with ``path`` as prefix."""
@@ -197,6 +235,8 @@ class DiffStat(BaseModel):
     ' path/file.txt | 16 ++++++++--------'
     >>> str(diffstat.with_path(Path('base')))
     ' base/path/file.txt | 16 ++++++++--------'
+    >>> DiffStat.from_str(' a | b.txt | 2 +-')
+    DiffStat(path=PosixPath('a | b.txt'), stat='2 +-')
     """
 
     path: Path
@@ -205,19 +245,122 @@ class DiffStat(BaseModel):
     stat: str
     """Diff Status Line."""
 
-    def __str__(self):
+    def __str__(self) -> str:
         return f" {self.path} | {self.stat}"
 
     @staticmethod
-    def from_str(line) -> "DiffStat":
+    def from_str(line: str) -> "DiffStat":
         """Create from ``git diff --stat`` Output."""
-        mat = _RE_DIFFSTAT.match(line)
-        assert mat, f"Invalid pattern {line}"
-        return DiffStat(**mat.groupdict())
+        path, sep, stat = line.rpartition(" | ")
+        assert sep and len(path) > 1 and path[0].isspace() and stat, f"Invalid pattern {line}"
+        return DiffStat.model_construct(path=Path(path[1:]), stat=stat)
 
     def with_path(self, path: Path) -> "DiffStat":
         """Return :any:`DiffStat` with ``path`` as prefix."""
-        return self.model_copy(update={"path": path / self.path})
+        return DiffStat.model_construct(path=path / self.path, stat=self.stat)
+
+
+def _parse_status(records: Iterator[bytes], branch: bool = False) -> Iterator[Status]:
+    """Parse ``git status --porcelain -z`` Output."""
+    if branch:
+        yield BranchStatus.from_str(next(records).decode("utf-8"))
+    for record in records:
+        if record:
+            # renames and copies are followed by an extra record with the original path
+            orig_path = next(records) if b"R" in record[:2] or b"C" in record[:2] else None
+            yield FileStatus.from_record(record, orig_path=orig_path)
+
+
+def _terminate(proc: subprocess.Popen):
+    """Terminate ``proc`` waiting for input."""
+    assert proc.stdin and proc.stdout
+    with suppress(BrokenPipeError):
+        proc.stdin.close()
+    proc.wait()
+    proc.stdout.close()
+
+
+def _get_filestamp(basepath: Path, filename: str) -> Tuple[str, int, int, int]:
+    """Inode, modification time and size of ``basepath / filename`` - or zeros if missing."""
+    try:
+        stat = os.stat(basepath / filename)
+    except FileNotFoundError:
+        return (filename, 0, 0, 0)
+    return (filename, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _get_link_or_copy(objects: Path) -> Callable[[str, str], str]:
+    """
+    Return a ``copy_function`` for :any:`shutil.copytree`, which hardlinks all files below ``objects``.
+
+    Git never modifies object files in place, just like ``git clone --local`` we can share them.
+    All other files are cloned copy-on-write (reflink) where the filesystem supports it.
+    Everything else falls back to a copy.
+    """
+    prefix = os.path.join(objects, "")
+    reflink = True
+
+    def link_or_copy(src: str, dst: str) -> str:
+        nonlocal reflink
+        if src.startswith(prefix):
+            try:
+                os.link(src, dst)
+            except OSError:
+                pass
+            else:
+                return dst
+        elif reflink:
+            if _reflink(src, dst):
+                return dst
+            # do not retry on every file of a filesystem without reflink support
+            reflink = False
+        return shutil.copy2(src, dst)
+
+    return link_or_copy
+
+
+_FICLONE = 0x40049409
+"""Linux ``ioctl`` request, which shares the data of one file with another one (``FICLONE``)."""
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """
+    Create ``dst`` as copy-on-write clone of ``src``, like ``cp --reflink``.
+
+    Btrfs and XFS support this on Linux. Return ``False`` if the platform or filesystem does not.
+    """
+    if sys.platform != "linux":  # pragma: no cover
+        return False
+    import fcntl  # pylint: disable=import-outside-toplevel
+
+    try:
+        with open(src, "rb") as srcfile, open(dst, "wb") as dstfile:
+            fcntl.ioctl(dstfile.fileno(), _FICLONE, srcfile.fileno())
+    except OSError:
+        return False
+    shutil.copystat(src, dst)  # pragma: no cover
+    return True  # pragma: no cover
+
+
+def _find_packed_ref(packed_refs: Path, ref: str) -> Optional[str]:
+    """Return the SHA of ``ref`` from ``packed_refs`` - or ``None`` if not found."""
+    try:
+        with open(packed_refs, encoding="utf-8") as file:
+            for line in file:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def _map_concurrent(func: Callable[["Git"], Any], gits: Tuple["Git", ...]) -> Dict["Git", Any]:
+    """Run ``func`` on all ``gits`` on a thread pool, as every call just waits for a ``git`` process."""
+    if not gits:
+        return {}
+    with ThreadPoolExecutor(max_workers=get_max_workers(len(gits))) as executor:
+        return dict(zip(gits, executor.map(func, gits)))
 
 
 class Git:
@@ -232,18 +375,48 @@ class Git:
     The easiest way to start with an existing clone:
 
     >>> git = Git.from_path()
+
+    Results of the read-only queries (:any:`is_cloned`, :any:`get_tag`, :any:`get_branch`, :any:`get_sha`,
+    :any:`get_upstream_branch`, :any:`get_url`) are cached. A cache entry is only valid as long as the files
+    below ``.git``, which git updates on a change (i.e. ``HEAD``, the refs and ``config``), remain untouched.
+
+    Revisions are resolved by a long-living ``git cat-file --batch-check`` process, which is
+    terminated by :any:`close`, by any modifying operation or latest on garbage collection.
+    The :any:`Git` instance can be used as context manager to terminate it explicitly.
+
+    With ``echo_stdout`` the standard output of git is reported via ``secho`` like the error output,
+    instead of passing it through - i.e. to collect the output of concurrent operations.
     """
 
-    def __init__(self, path: Path, clone_cache: Optional[Path] = None, secho=None):
+    def __init__(self, path: Path, clone_cache: Optional[Path] = None, secho=None, echo_stdout: bool = False):
         self.path = path
         self.clone_cache = clone_cache
         self.secho = secho or no_echo
+        self.echo_stdout = echo_stdout
+        self._cache: Dict[str, Tuple[Stamp, Any]] = {}
+        self._catfile: Optional[subprocess.Popen] = None
+        self._catfile_finalizer: Optional[weakref.finalize] = None
 
     def __eq__(self, other):
         if isinstance(other, Git):
             return (self.path, self.clone_cache, self.secho) == (other.path, other.clone_cache, other.secho)
         return NotImplemented
 
+    def __enter__(self) -> "Git":
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    def close(self):
+        """Terminate long-living helper processes."""
+        if self._catfile_finalizer:
+            self._catfile_finalizer()
+        self._catfile = self._catfile_finalizer = None
+
+    def __hash__(self):
+        return hash((self.path, self.clone_cache))
+
     def __repr__(self):
         return get_repr(self, (self.path,))
 
@@ -262,25 +435,29 @@ class Git:
         result = run(("git", "rev-parse", "--show-cdup"), capture_output=True, check=False, cwd=path)
         if result.stderr:
             raise NoGitError()
-        cdup = result.stdout.decode("utf-8").strip()
+        cdup = result.stdout.strip().decode("utf-8")
         return (path / cdup).resolve()
 
     @staticmethod
     def from_path(path: Optional[Path] = None, secho=None) -> "Git":
         """Create GIT Repo Helper from ``path``."""
         path = Git.find_path(path=path)
-        clone_cache = AppConfig().options.clone_cache
+        clone_cache = get_clone_cache()
         return Git(path=path, clone_cache=clone_cache, secho=secho)
 
     def is_cloned(self) -> bool:
         """Determine if clone already exists."""
         if not self.path.exists() or not self.path.is_dir():
             return False
-        result = self._run(("rev-parse", "--show-cdup"), capture_output=True, check=False)
-        cloned = not result.stderr and not result.stdout.strip()
+        cloned = self._cached("cloned", ("HEAD", "config"), self._is_cloned)
         _LOGGER.info("Git(%r).is_cloned() = %r", str(self.path), cloned)
         return cloned
 
+    def _is_cloned(self) -> bool:
+        # A clone is a work tree (not its ``.git`` directory) and we are at its top (no ``cdup``).
+        result = self._run(("rev-parse", "--is-inside-work-tree", "--show-cdup"), capture_output=True, check=False)
+        return not result.stderr and result.stdout.split() == [b"true"]
+
     def check(self):
         """Check Clone for Existence."""
         if not self.is_cloned():
@@ -288,17 +465,30 @@ class Git:
 
     def set_config(self, name, value):
         """Set Git Configuration Variable ``name`` to ``value``."""
+        self._invalidate()
         self._run(("config", name, value))
 
-    def clone(self, url, revision: Optional[str] = None, depth: Optional[int] = None):
+    def clone(
+        self, url, revision: Optional[str] = None, depth: Optional[int] = None, clone_filter: Optional[str] = None
+    ):
         """
         Clone ``url`` and checkout ``revision``.
 
         The checkout is done to ``self.path``.
         If ``self.clone_cache`` directory path is set, the clone uses the given path as local filesystem cache.
+        Otherwise ``clone_filter`` (i.e. ``blob:none``) creates a partial clone.
         """
-        _LOGGER.info("Git(%r).clone(%r, revision=%r, depth=%r)", str(self.path), url, revision, depth)
-        assert not self.path.exists() or not any(self.path.iterdir())
+        _LOGGER.info(
+            "Git(%r).clone(%r, revision=%r, depth=%r, clone_filter=%r)",
+            str(self.path),
+            url,
+            revision,
+            depth,
+            clone_filter,
+        )
+        self._invalidate()
+        assert is_empty_or_missing(self.path)
+        filter_options: Tuple[str, ...] = (f"--filter={clone_filter}",) if clone_filter else ()
         # This is bad code, because:
         # * `git clone` does have an option for SHA/tag/revision
         # * we re-use a filesystem cache for clones.
@@ -311,19 +501,38 @@ class Git:
             self.path.mkdir(parents=True)
             self._run(("init",), capture_output=True)
             self._run(("remote", "add", "origin", str(url)))
-            self._run(("fetch", "--depth", str(depth), "origin", revision), capture_output=True)
+            self._run(("fetch", *filter_options, "--depth", str(depth), "origin", revision), capture_output=True)
         elif depth:
-            run(("git", "clone", "--depth", str(depth), "--", str(url), str(self.path)))
+            self._run_outside(("git", "clone", *filter_options, "--depth", str(depth), "--", str(url), str(self.path)))
+        elif revision and not _RE_SHA.match(revision) and self._clone_ref(url, revision, filter_options):
+            return
         else:
-            run(("git", "clone", "--", str(url), str(self.path)))
+            self._run_outside(("git", "clone", *filter_options, "--", str(url), str(self.path)))
         if revision:
             self._run(("checkout", revision), capture_output=True)
 
+    def _clone_ref(self, url, revision: str, options: Tuple[str, ...] = ()) -> bool:
+        """Clone ``url`` with branch or tag ``revision`` checked out. Return ``False`` if there is no such ref."""
+        cmd = ("git", "clone", *options, "--branch", revision, "--", str(url), str(self.path))
+        try:
+            # captured - the error on a missing ref must not show up, as the plain clone succeeds instead
+            run(cmd, capture_output=True)
+        except subprocess.CalledProcessError:
+            _LOGGER.debug("%r is not a branch or tag", revision)
+            return False
+        return True
+
     def _clone_cache(self, url):
         baseurl = strip_user_password(url)
-        # cache index
-        key = hashlib.sha256(baseurl.encode("utf-8")).hexdigest()
+        # cache index - just a filesystem-safe name, no cryptographic strength needed
+        key = hashlib.blake2b(baseurl.encode("utf-8"), digest_size=16).hexdigest()
         cache = self.clone_cache / key
+        # take over cache entries named by former versions
+        legacy = self.clone_cache / hashlib.sha256(baseurl.encode("utf-8")).hexdigest()
+        if legacy.exists():
+            with path_lock(legacy):
+                if legacy.exists() and not cache.exists():
+                    legacy.rename(cache)
 
         with atomic_update_or_create_path(cache) as tmp_cache:
             # Restore user/password credentials, repair corrupted cache
@@ -352,27 +561,34 @@ class Git:
             if not tmp_cache.exists():
                 self.secho("Initializing clone-cache")
                 tmp_cache.mkdir(parents=True)
-                run(("git", "clone", "--", str(url), str(tmp_cache)))
+                self._run_outside(("git", "clone", "--", str(url), str(tmp_cache)))
             _LOGGER.debug("Copy %s to  %s)", tmp_cache, self.path)
-            shutil.copytree(tmp_cache, self.path)
+            shutil.copytree(tmp_cache, self.path, copy_function=_get_link_or_copy(tmp_cache / ".git" / "objects"))
             # Remove user/password credentials from cache
             self._run(("remote", "remove", "origin"), cwd=tmp_cache)
 
     def get_tag(self) -> Optional[str]:
         """Get Current Tag."""
-        tag = self._run2str(("describe", "--exact-match", "--tags"), check=False) or None
+        tag = self._cached(
+            "tag",
+            (*self._get_head_files(), *self._get_tag_files()),
+            lambda: self._run2str(("describe", "--exact-match", "--tags"), check=False) or None,
+        )
         _LOGGER.info("Git(%r).get_tag() = %r", str(self.path), tag)
         return tag
 
     def get_branch(self) -> Optional[str]:
         """Get Current Branch."""
-        branch = self._run2str(("branch",), regex=_RE_BRANCH)
+        branch = self._cached("branch", self._get_head_files(), self._read_head_branch)
         _LOGGER.info("Git(%r).get_branch() = %r", str(self.path), branch)
         return branch
 
     def get_sha(self, revision: Optional[str] = None) -> Optional[str]:
         """Get Current SHA."""
-        sha = self._run2str(("rev-parse", revision or "HEAD"), check=False) or None
+        if revision:
+            sha = self._resolve(revision)
+        else:
+            sha = self._cached("sha", self._get_head_files(), lambda: self._read_head_sha() or self._resolve("HEAD"))
         _LOGGER.info("Git(%r).get_sha(%r) = %r", str(self.path), revision, sha)
         return sha
 
@@ -382,22 +598,81 @@ class Git:
 
         We try several things, the winner takes it all:
 
-        1. Get Current Tag
-        2. Get Current Branch
+        1. Get Current Branch
+        2. Get Current Tag
         3. Get SHA.
         4. ``None`` if empty repo.
+
+        Tag and SHA are determined by a single git call.
+        """
+        revision = self.get_branch()
+        if not revision:
+            tag, _, sha = self.describe_head()
+            revision = tag or sha
+        return revision
+
+    def describe_head(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """
-        return self.get_branch() or self.get_tag() or self.get_sha()
+        Determine tag, branch and SHA of ``HEAD`` at once.
+
+        This is one git call instead of :any:`get_tag`, :any:`get_branch` and :any:`get_sha`,
+        which take the results over into their caches.
+        If multiple tags point to ``HEAD``, the choice is left to :any:`get_tag`.
+
+        Returns:
+            Tuple of tag, branch and SHA. Each of them is ``None`` if not available.
+        """
+        result = self._describe_head()
+        _LOGGER.info("Git(%r).describe_head() = %r", str(self.path), result)
+        return result
+
+    def _describe_head(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        head_files = self._get_head_files()
+        tag_files = (*head_files, *self._get_tag_files())
+        stamps = {"tag": self._get_stamp(tag_files), "branch": self._get_stamp(head_files)}
+        stamps["sha"] = stamps["branch"]
+        cached = {}
+        for name, stamp in stamps.items():
+            entry = self._cache.get(name)
+            if stamp is None or entry is None or entry[0] != stamp:
+                break
+            cached[name] = entry[1]
+        else:
+            return cached["tag"], cached["branch"], cached["sha"]
+        output = self._run2str(("log", "-1", "--decorate=short", "--format=%H%x00%D"), check=False) or ""
+        sha, _, decoration = output.partition("\0")
+        branch = None
+        tags = []
+        for name in decoration.split(", "):
+            if name.startswith("HEAD -> "):
+                branch = name[8:]
+            elif name.startswith("tag: "):
+                tags.append(name[5:])
+        values = {"tag": tags[0] if tags else None, "branch": branch, "sha": sha or None}
+        if len(tags) > 1:
+            del values["tag"]
+        for name, value in values.items():
+            stamp = stamps[name]
+            if stamp is not None:
+                self._cache[name] = (stamp, value)
+        tag = self.get_tag() if len(tags) > 1 else values["tag"]
+        return tag, branch, sha or None
 
     def get_upstream_branch(self) -> Optional[str]:
         """Get Current Upstream Branch."""
-        branch = self._run2str(("branch", "--format", "%(HEAD) %(upstream:short)"), regex=_RE_BRANCH)
+        branch = self._cached(
+            "upstream_branch",
+            (*self._get_head_files(), "config"),
+            lambda: self._run2str(("branch", "--format", "%(HEAD) %(upstream:short)"), regex=_RE_BRANCH),
+        )
         _LOGGER.info("Git(%r).get_upstream_branch() = %r", str(self.path), branch)
         return branch
 
     def get_url(self) -> Optional[str]:
         """Get Current URL of ``origin``."""
-        url = self._run2str(("remote", "-v"), regex=_RE_URL, check=False)
+        url = self._cached(
+            "url", ("config",), lambda: self._run2str(("remote", "get-url", "origin"), check=False) or None
+        )
         _LOGGER.info("Git(%r).get_url() = %r", str(self.path), url)
         return url
 
@@ -425,6 +700,7 @@ class Git:
             args.append(branch)
         if force:
             args.append("--force")
+        self._invalidate()
         self._run(args, paths=paths)
         _LOGGER.info("Git(%r).checkout(revision=%r, paths=%r, force=%r)", str(self.path), revision, paths, force)
 
@@ -432,6 +708,7 @@ class Git:
         """Fetch."""
         _LOGGER.info("Git(%r).fetch(shallow=%r)", str(self.path), shallow)
         assert not shallow or not unshallow, "shallow and unshallow are mutally exclusive"
+        self._invalidate()
         if shallow:
             self._run(("fetch", "origin", shallow))
         elif unshallow:
@@ -442,11 +719,13 @@ class Git:
     def merge(self, commit):
         """Merge."""
         _LOGGER.info("Git(%r).merge(%r)", str(self.path), commit)
+        self._invalidate()
         self._run(("merge", commit))
 
     def rebase(self):
         """Rebase."""
         _LOGGER.info("Git(%r).rebase()", str(self.path))
+        self._invalidate()
         self._run(("rebase",))
 
     def add(self, paths: Optional[Paths] = None, force: bool = False, all_: bool = False):
@@ -495,6 +774,7 @@ class Git:
             paths: File paths.
         """
         _LOGGER.info("Git(%r).reset(%r)", str(self.path), paths)
+        self._invalidate()
         self._run(("reset",), paths=paths)
 
     def commit(self, msg: str, paths: Optional[Paths] = None, all_: bool = False):
@@ -509,6 +789,7 @@ class Git:
             all_: commit all changed files
         """
         _LOGGER.info("Git(%r).commit(%r, paths=%r, all_=%r)", str(self.path), msg, paths, all_)
+        self._invalidate()
         args = ["commit", "-m", msg]
         if all_:
             args.append("--all")
@@ -526,6 +807,7 @@ class Git:
             force: Replace tag if exists.
         """
         _LOGGER.info("Git(%r).tag(%r, msg=%r)", str(self.path), name, msg)
+        self._invalidate()
         args = ["tag", name]
         if force:
             args.append("--force")
@@ -540,24 +822,43 @@ class Git:
             cmd.append(pattern)
         return tuple(self._run2lines(cmd, skip_empty=True))
 
-    def status(self, paths: Optional[Paths] = None, branch: bool = False) -> Iterator[Status]:
+    def status(
+        self, paths: Optional[Paths] = None, branch: bool = False, untracked: bool = True
+    ) -> Generator[Status, None, None]:
         """
         Git Status.
 
         Keyword Args:
             paths: files and/or directories to be checked
             branch: Show branch too.
+            untracked: Report untracked files. Skipping them saves git from scanning untracked directories.
         """
-        _LOGGER.info("Git(%r).status(paths=%r, branch=%r)", str(self.path), paths, branch)
-        if branch:
-            lines = self._run2lines(("status", "--porcelain", "--branch"), paths=paths)
-            yield BranchStatus.from_str(lines[0])
-            lines = lines[1:]
-        else:
-            lines = self._run2lines(("status", "--porcelain"), paths=paths)
-        for line in lines:
-            if line:
-                yield FileStatus.from_str(line)
+        _LOGGER.info("Git(%r).status(paths=%r, branch=%r, untracked=%r)", str(self.path), paths, branch, untracked)
+        args = ("status", "--porcelain", "-z")
+        booloptions = (("--branch", branch), ("--untracked-files=no", not untracked))
+        with closing(self._run_stream(args, paths=paths, booloptions=booloptions)) as records:
+            yield from _parse_status(records, branch=branch)
+
+    @staticmethod
+    def status_many(gits: Iterable["Git"], untracked: bool = True) -> Dict["Git", List[Status]]:
+        """
+        Git Status on multiple clones at once.
+
+        The ``git status`` calls run concurrently on a thread pool.
+
+        Args:
+            gits: Clones.
+
+        Keyword Args:
+            untracked: Report untracked files.
+
+        Returns:
+            Status per clone.
+        """
+        gits = tuple(gits)
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Git.status_many(%r, untracked=%r)", [str(git.path) for git in gits], untracked)
+        return _map_concurrent(lambda git: list(git.status(untracked=untracked)), gits)
 
     def diff(self, paths: Optional[Paths] = None, prefix: Optional[Path] = None):
         """
@@ -584,9 +885,13 @@ class Git:
             paths: Paths.
         """
         _LOGGER.info("Git(%r).diffstat(paths=%r)", str(self.path), paths)
-        lines = self._run2lines(("diff", "--stat"), paths=paths)[:-1]
-        for line in lines:
-            yield DiffStat.from_str(line)
+        # the last line is the summary
+        with closing(self._run_stream(("diff", "--stat"), paths=paths, sep=b"\n")) as records:
+            previous = None
+            for record in records:
+                if previous is not None:
+                    yield DiffStat.from_str(previous.decode("utf-8"))
+                previous = record
 
     def submodule_update(self, init: bool = False, recursive: bool = False):
         """
@@ -601,15 +906,24 @@ class Git:
 
     def has_index_changes(self) -> bool:
         """Let you know if index has changes."""
-        return any(status.has_index_changes() for status in self.status())
+        return self._diff_quiet(("diff", "--cached", "--quiet"))
 
     def has_work_changes(self) -> bool:
         """Let you know if work has changes."""
-        return any(status.has_work_changes() for status in self.status())
+        return self._diff_quiet(("diff", "--quiet"))
 
     def has_changes(self) -> bool:
         """Let you know if work has changes."""
-        return any(status.has_changes() for status in self.status())
+        # untracked files are not reported - any record is a change. git is stopped on the first one.
+        with closing(self.status(untracked=False)) as statuses:
+            return next(statuses, None) is not None
+
+    def _diff_quiet(self, args: Args) -> bool:
+        """Return ``True`` if ``git diff --quiet`` reports differences. Just the exit code is evaluated."""
+        result = self._run(args, check=False, capture_output=True)
+        if result.returncode not in (0, 1):
+            raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+        return result.returncode == 1
 
     def is_empty(self):
         """
@@ -622,19 +936,73 @@ class Git:
         * nothing stashed
         """
         _LOGGER.info("Git(%r).is_empty()", str(self.path))
-        lines = self._run2lines(("status", "--porcelain", "--branch"))
-        if len(lines) > 1:
-            return False
-        if self._run2str(("stash", "list")):
+        if self._has_stash():
             return False
-        if lines[0].startswith("## No commits yet on "):  # pragma: no cover
+        # the branch line and at most one file status is all we need
+        with closing(self._run_stream(("status", "--porcelain", "-z", "--branch"))) as records:
+            branchinfo = next(records).decode("utf-8")
+            if next(records, None) is not None:
+                return False
+        if branchinfo.startswith("## No commits yet on "):  # pragma: no cover
             return True
-        if "[ahead " in lines[0]:
+        if "[ahead " in branchinfo:
             return False
         if not self.get_url():
             return False
         return True
 
+    def _has_stash(self) -> bool:
+        """Check for stashed changes - on the filesystem, if possible."""
+        gitdir = self.path / ".git"
+        if not gitdir.is_dir():
+            # submodules and worktrees
+            return bool(self._run2str(("stash", "list")))
+        if (gitdir / "refs" / "stash").exists():
+            return True
+        try:
+            packed_refs = (gitdir / "packed-refs").read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return False
+        return " refs/stash\n" in packed_refs
+
+    def _read_head_sha(self) -> Optional[str]:
+        """Read the SHA of ``HEAD`` from the filesystem - ``None`` if this needs ``git``."""
+        gitdir = self.path / ".git"
+        try:
+            head = (gitdir / "HEAD").read_text(encoding="utf-8").strip()
+            if not head.startswith("ref: "):
+                sha: Optional[str] = head
+            else:
+                ref = head[5:]
+                try:
+                    sha = (gitdir / ref).read_text(encoding="utf-8").strip()
+                except FileNotFoundError:
+                    sha = _find_packed_ref(gitdir / "packed-refs", ref)
+        except OSError:
+            # submodules and worktrees, and not cloned at all
+            return None
+        if sha and _RE_FULL_SHA.match(sha):
+            return sha
+        # unborn branches, symbolic refs and other formats
+        return None
+
+    def _read_head_branch(self) -> Optional[str]:
+        """Read the current branch from the filesystem and fall back to ``git branch``."""
+        gitdir = self.path / ".git"
+        try:
+            head = (gitdir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            # submodules and worktrees, and not cloned at all
+            return self._run2str(("branch",), regex=_RE_BRANCH)
+        if not head.startswith("ref: refs/heads/"):
+            # detached
+            return None
+        ref = head[5:]
+        if not (gitdir / ref).is_file() and not _find_packed_ref(gitdir / "packed-refs", ref):
+            # unborn branch
+            return None
+        return ref[11:]
+
     def get_shallow(self) -> Optional[str]:
         """Get Shallow."""
         try:
@@ -642,6 +1010,84 @@ class Git:
         except FileNotFoundError:
             return None
 
+    def _cached(self, name: str, filenames: Tuple[str, ...], func: Callable[[], Any]) -> Any:
+        """Return cached result of ``func`` as long as ``filenames`` within ``.git`` are unchanged."""
+        stamp = self._get_stamp(filenames)
+        if stamp is None:
+            return func()
+        try:
+            cached_stamp, value = self._cache[name]
+        except KeyError:
+            pass
+        else:
+            if cached_stamp == stamp:
+                return value
+        value = func()
+        self._cache[name] = (stamp, value)
+        return value
+
+    def _invalidate(self):
+        """Drop all cached results."""
+        self._cache.clear()
+        self.close()
+
+    def _resolve(self, revision: str) -> Optional[str]:
+        """Resolve ``revision`` to SHA via ``git cat-file --batch-check``."""
+        if "\n" in revision:
+            return self._run2str(("rev-parse", revision), check=False) or None
+        catfile = self._catfile
+        if not catfile or catfile.poll() is not None:
+            self.close()
+            catfile = subprocess.Popen(
+                ("git", "cat-file", "--batch-check=%(objectname)"),
+                cwd=self.path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self._catfile = catfile
+            self._catfile_finalizer = weakref.finalize(self, _terminate, catfile)
+        assert catfile.stdin and catfile.stdout
+        try:
+            catfile.stdin.write(f"{revision}\n".encode())
+            catfile.stdin.flush()
+            line = catfile.stdout.readline().rstrip().decode("utf-8")
+        except BrokenPipeError:
+            # not a git clone
+            line = ""
+        _LOGGER.debug("cat-file(%r, cwd=%r) = %r", revision, str(self.path), line)
+        # missing or ambiguous revisions are reported as '<revision> missing'
+        if not line or " " in line:
+            return None
+        return line
+
+    def _get_stamp(self, filenames: Tuple[str, ...]) -> Optional[Stamp]:
+        """Identify the state of ``filenames`` within ``.git`` by inode, modification time and size."""
+        gitdir = self.path / ".git"
+        if not gitdir.is_dir():
+            # submodules and worktrees, and not cloned at all
+            return None
+        return tuple(_get_filestamp(gitdir, filename) for filename in filenames)
+
+    def _get_head_files(self) -> Tuple[str, ...]:
+        """Files within ``.git`` describing the current ``HEAD``."""
+        try:
+            head = (self.path / ".git" / "HEAD").read_text(encoding="utf-8")
+        except OSError:
+            return ("HEAD",)
+        if head.startswith("ref: "):
+            return ("HEAD", head[5:].strip(), "packed-refs")
+        return ("HEAD", "packed-refs")
+
+    def _get_tag_files(self) -> Tuple[str, ...]:
+        """Directories within ``.git`` holding loose tags - nested ones (i.e. ``release/v1``) included."""
+        gitdir = self.path / ".git"
+        filenames = ["refs/tags"]
+        for dirpath, dirnames, _ in os.walk(gitdir / "refs" / "tags"):
+            reldir = os.path.relpath(dirpath, gitdir)
+            filenames.extend(os.path.join(reldir, dirname) for dirname in sorted(dirnames))
+        return tuple(filenames)
+
     def _run(
         self,
         args: Args,
@@ -650,22 +1096,36 @@ class Git:
         cwd: Optional[Path] = None,
         **kwargs,
     ):
-        cmd = ["git"]
-        cmd.extend(args)
-        for name, value in booloptions or ():
-            if value:
-                cmd.append(name)
-        if paths:
-            cmd.append("--")
-            cmd.extend([str(path) for path in paths])
+        cmd = self._get_cmd(args, paths=paths, booloptions=booloptions)
         cwd = cwd or self.path
-        return run(cmd, cwd=cwd, secho=self.secho, **kwargs)
+        return run(cmd, cwd=cwd, secho=self.secho, echo_stdout=self.echo_stdout, **kwargs)
+
+    def _run_outside(self, cmd: Tuple[str, ...]):
+        """Run ``cmd`` not bound to ``self.path`` - its output just passes through, unless ``echo_stdout`` is set."""
+        if self.echo_stdout:
+            return run(cmd, secho=self.secho, echo_stdout=True)
+        return run(cmd)
+
+    def _run_stream(
+        self, args: Args, paths: Optional[Paths] = None, booloptions: Optional[BoolOptions] = None, sep: bytes = b"\0"
+    ) -> Generator[bytes, None, None]:
+        cmd = self._get_cmd(args, paths=paths, booloptions=booloptions)
+        return run_stream(cmd, cwd=self.path, sep=sep)
+
+    @staticmethod
+    def _get_cmd(
+        args: Args, paths: Optional[Paths] = None, booloptions: Optional[BoolOptions] = None
+    ) -> Tuple[str, ...]:
+        options = (name for name, value in booloptions or () if value)
+        if paths:
+            return ("git", *args, *options, "--", *map(str, paths))
+        return ("git", *args, *options)
 
     def _run2str(self, args: Args, paths: Optional[Paths] = None, check=True, regex=None, **kwargs) -> Optional[str]:
         result = self._run(args, paths=paths, check=check, capture_output=True, **kwargs)
-        if result.stderr.strip():
+        if result.stderr and not result.stderr.isspace():
             return ""
-        value = result.stdout.decode("utf-8").rstrip()
+        value = result.stdout.rstrip().decode("utf-8")
         if regex:
             for line in value.split("\n"):
                 mat = regex.match(line)
@@ -674,11 +1134,11 @@ class Git:
             return None
         return value
 
-    def _run2lines(
-        self, args: Args, paths: Optional[Paths] = None, check=True, regex=None, skip_empty: bool = False
-    ) -> List[str]:
-        result = self._run2str(args, paths=paths, check=check, regex=regex) or ""
-        lines = result.split("\n")
+    def _run2lines(self, args: Args, paths: Optional[Paths] = None, check=True, skip_empty: bool = False) -> List[str]:
+        result = self._run(args, paths=paths, check=check, capture_output=True)
+        if result.stderr and not result.stderr.isspace():
+            return []
+        lines = result.stdout.decode("utf-8").splitlines()
         if skip_empty:
-            lines = [line for line in lines if line]
+            return [line for line in lines if line]
         return lines
@@ -19,20 +19,25 @@ Multi Repository Management.
 
 The :any:`GitWS` class provides a simple facade to all Git Workspace functionality.
 """
-import urllib
+import logging
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Tuple
+from threading import Event, get_ident
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
-from ._deptree import DepNode, get_deptree
 from ._iters import ManifestIter, ProjectIter, create_filter
 from ._manifestformatmanager import ManifestFormatManager, get_manifest_format_manager
 from ._url import urlrel, urlsub
-from ._util import LOGGER, get_repr, no_echo, removesuffix, resolve_relative, run
+from ._util import LOGGER, get_max_workers, get_repr, is_empty_or_missing, no_echo, resolve_relative, run
 from ._workspacemanager import WorkspaceManager
 from .appconfig import AppConfig
 from .clone import Clone, map_paths
 from .const import COLOR_ACTION, COLOR_BANNER, COLOR_SKIP, MANIFEST_PATH_DEFAULT, MANIFESTS_PATH
 from .datamodel import (
+    AppConfigData,
     GroupFilters,
     Manifest,
     ManifestSpec,
@@ -47,6 +52,11 @@ from .gitwsmanifestformat import save
 from .manifestfinder import find_manifest
 from .workspace import Workspace
 
+if TYPE_CHECKING:
+    from ._deptree import DepNode
+
+_RE_NAME = re.compile(r"([^/:]+?)(?:\.git)?/*(?:[?#].*)?\Z")
+
 
 class GitWS:
     """
@@ -81,6 +91,7 @@ class GitWS:
         self.group_filters = group_filters
         self.secho = secho or no_echo
         self.manifest_format_manager = manifest_format_manager or get_manifest_format_manager()
+        self.__manifest_cache: Optional[Tuple[ManifestSpec, str, Manifest]] = None
 
     def __eq__(self, other):
         if isinstance(other, GitWS):
@@ -332,8 +343,7 @@ class GitWS:
             secho: :any:`click.secho` like print method for verbose output.
         """
         secho = secho or no_echo
-        parsedurl = urllib.parse.urlparse(url)
-        name = removesuffix(Path(parsedurl.path).name, ".git")
+        name = _get_name(url)
         if main_path is None:
             main_path = Path.cwd() / name / name
         else:
@@ -349,10 +359,10 @@ class GitWS:
         clone_cache = options.clone_cache
         if depth is None:
             depth = options.depth
-        if main_path.exists() and any(main_path.iterdir()):
+        if not is_empty_or_missing(main_path):
             raise NotEmptyError(main_path_rel)
         git = Git(main_path_rel, clone_cache=clone_cache, secho=secho)
-        git.clone(url, revision=revision, depth=depth)
+        git.clone(url, revision=revision, depth=depth, clone_filter=options.clone_filter)
         return GitWS.create(
             path,
             main_path=main_path,
@@ -370,6 +380,7 @@ class GitWS:
         prune: bool = False,
         rebase: bool = False,
         force: bool = False,
+        jobs: Optional[int] = None,
     ):
         """
         Create/Update all dependent projects.
@@ -385,14 +396,20 @@ class GitWS:
             prune: Remove obsolete files from workspace, including non-project data!
             rebase: Rebase instead of merge.
             force: Enforce to prune repositories with changes.
+            jobs: Update up to ``jobs`` projects concurrently. The ``jobs`` option by default.
         """
         workspace = self.workspace
-        depth = workspace.app_config.options.depth
+        options = workspace.app_config.options
 
         # Update Clones
-        for clone in self._foreach(project_paths=project_paths, skip_main=skip_main, resolve_url=True):
-            clone.check(diff=False, exists=False)
-            self._update(clone, rebase, depth)
+        if jobs is None:
+            jobs = options.jobs
+        if jobs and jobs > 1:
+            self._update_concurrent(project_paths, skip_main, rebase, options, jobs)
+        else:
+            for clone in self._foreach(project_paths=project_paths, skip_main=skip_main, resolve_url=True):
+                clone.check(diff=False, exists=False)
+                self._update(clone, rebase, options)
 
         # Update Workspace
         mngr = WorkspaceManager(workspace, secho=self.secho)
@@ -415,27 +432,87 @@ class GitWS:
             self.secho("===== Update Referenced Files =====", fg=COLOR_BANNER)
             mngr.update(force=force)
 
-    def _update(self, clone: Clone, rebase: bool, depth: Optional[int]):
+    def _update_concurrent(
+        self, project_paths: Optional[ProjectPaths], skip_main: bool, rebase: bool, options: AppConfigData, jobs: int
+    ):
+        # Projects of one batch are independent, the next batch depends on their manifests.
+        # The output of every clone is collected and reported in order.
+        # Just like one after another, updates, which are not started yet, are skipped after the first failure.
+        workspace = self.workspace
+        project_paths_filter = self._create_project_paths_filter(project_paths)
+        batches = self._get_project_iter(skip_main=skip_main, resolve_url=True).batches()
+        failed = Event()
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for projects in batches:
+                updates = []
+                for project in projects:
+                    outputs: List[Tuple[tuple, dict]] = []
+                    records: List[logging.LogRecord] = []
+                    clone = Clone.from_project(workspace, project, secho=_get_buffer_secho(outputs), echo_stdout=True)
+                    future = None
+                    if project_paths_filter(project):
+                        with _collect_logging(records):
+                            clone.check(diff=False, exists=False)
+                        future = executor.submit(self._update_unless_failed, failed, clone, rebase, options)
+                    updates.append((clone, future, records, outputs))
+                self._report_updates(updates)
+
+    def _report_updates(self, updates):
+        error: Optional[Exception] = None
+        for clone, future, records, outputs in updates:
+            if error is None:
+                if not future:
+                    self.secho(f"===== SKIPPING {clone.info} =====", fg=COLOR_SKIP)
+                    continue
+                self._echo_banner(clone, records)
+                try:
+                    future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    error = exc
+                _flush_buffer_secho(self.secho, outputs)
+            elif future and (future.exception() or future.result()):
+                # updated concurrently to the failed one
+                self._echo_banner(clone, records)
+                _flush_buffer_secho(self.secho, outputs)
+        if error is not None:
+            raise error
+
+    def _echo_banner(self, clone: Clone, records: List[logging.LogRecord]):
+        self.secho(f"===== {clone.info} =====", fg=COLOR_BANNER)
+        for record in records:
+            LOGGER.handle(record)
+
+    def _update_unless_failed(self, failed: Event, clone: Clone, rebase: bool, options: AppConfigData) -> bool:
+        """Update ``clone`` - unless ``failed`` is set already, which is set on failure. Return ``True`` if run."""
+        if failed.is_set():
+            return False
+        try:
+            self._update(clone, rebase, options)
+        except BaseException:
+            failed.set()
+            raise
+        return True
+
+    def _update(self, clone: Clone, rebase: bool, options: AppConfigData):
         # Clone
         project = clone.project
         git = clone.git
+        secho = git.secho
         if git.is_cloned():
             # Determine current version
-            tag = git.get_tag()
-            branch = git.get_branch()
-            sha = git.get_sha()
+            tag, branch, sha = git.describe_head()
             revision = branch or tag or sha
 
             if project.revision in (sha, tag) and not branch:
-                self.secho("Nothing to do.", fg=COLOR_ACTION)
+                secho("Nothing to do.", fg=COLOR_ACTION)
             elif git.get_shallow():
-                self.secho("Fetching.", fg=COLOR_ACTION)
+                secho("Fetching.", fg=COLOR_ACTION)
                 git.fetch(shallow=project.revision or revision)
                 shallow_sha = git.get_sha(revision="FETCH_HEAD")
                 git.checkout(shallow_sha)
             else:
                 # Fetch
-                self.secho("Fetching.", fg=COLOR_ACTION)
+                secho("Fetching.", fg=COLOR_ACTION)
                 git.fetch()
 
                 # Checkout
@@ -446,15 +523,15 @@ class GitWS:
                 # Rebase / Merge
                 if branch and git.get_upstream_branch():
                     if rebase:
-                        self.secho(f"Rebasing branch {branch!r}.", fg=COLOR_ACTION)
+                        secho(f"Rebasing branch {branch!r}.", fg=COLOR_ACTION)
                         git.rebase()
                     else:
-                        self.secho(f"Merging branch {branch!r}.", fg=COLOR_ACTION)
+                        secho(f"Merging branch {branch!r}.", fg=COLOR_ACTION)
                         git.merge(f"origin/{branch}")
 
         else:
-            self.secho(f"Cloning {project.url!r}.", fg=COLOR_ACTION)
-            git.clone(project.url, revision=project.revision, depth=depth)
+            secho(f"Cloning {project.url!r}.", fg=COLOR_ACTION)
+            git.clone(project.url, revision=project.revision, depth=options.depth, clone_filter=options.clone_filter)
 
         if project.submodules:
             git.submodule_update(init=True, recursive=True)
@@ -478,13 +555,17 @@ class GitWS:
         Yields:
             :any:`Status`
         """
-        for clone, cpaths in map_paths(tuple(self.clones()), paths):
-            if banner:
-                self.secho(f"===== {clone.info} =====", fg=COLOR_BANNER)
-            clone.check()
-            path = clone.git.path
-            for status in clone.git.status(paths=cpaths, branch=branch):
-                yield status.with_path(path)
+        clonepaths = tuple(map_paths(tuple(self.clones()), paths))
+        # query all clones concurrently upfront, but report in order
+        with ThreadPoolExecutor(max_workers=get_max_workers(len(clonepaths))) as executor:
+            futures = [executor.submit(_get_status, clone.git, cpaths, branch) for clone, cpaths in clonepaths]
+            for (clone, _), future in zip(clonepaths, futures):
+                if banner:
+                    self.secho(f"===== {clone.info} =====", fg=COLOR_BANNER)
+                clone.check()
+                path = clone.git.path
+                for status in future.result():
+                    yield status.with_path(path)
 
     def diff(self, paths: Optional[Tuple[Path, ...]] = None):
         """
@@ -508,12 +589,16 @@ class GitWS:
         Yields:
             :any:`DiffStat`
         """
-        for clone, cpaths in map_paths(tuple(self.clones()), paths):
-            self.secho(f"===== {clone.info} =====", fg=COLOR_BANNER)
-            clone.check()
-            path = clone.git.path
-            for diffstat in clone.git.diffstat(paths=cpaths):
-                yield diffstat.with_path(path)
+        clonepaths = tuple(map_paths(tuple(self.clones()), paths))
+        # query all clones concurrently upfront, but report in order
+        with ThreadPoolExecutor(max_workers=get_max_workers(len(clonepaths))) as executor:
+            futures = [executor.submit(_get_diffstat, clone.git, cpaths) for clone, cpaths in clonepaths]
+            for (clone, _), future in zip(clonepaths, futures):
+                self.secho(f"===== {clone.info} =====", fg=COLOR_BANNER)
+                clone.check()
+                path = clone.git.path
+                for diffstat in future.result():
+                    yield diffstat.with_path(path)
 
     def checkout(self, paths: Optional[Tuple[Path, ...]] = None, branch: Optional[str] = None, force: bool = False):
         """
@@ -534,14 +619,16 @@ class GitWS:
                 clone.git.checkout(revision=clone.project.revision, paths=cpaths, branch=branch, force=force)
         else:
             # Checkout all clones
-            depth = self.workspace.app_config.options.depth
+            options = self.workspace.app_config.options
             for clone in self.clones(resolve_url=True):
                 self.secho(f"===== {clone.info} =====", fg=COLOR_BANNER)
                 git = clone.git
                 project = clone.project
                 if not git.is_cloned():
                     self.secho(f"Cloning {project.url!r}.", fg=COLOR_ACTION)
-                    git.clone(project.url, revision=project.revision, depth=depth)
+                    git.clone(
+                        project.url, revision=project.revision, depth=options.depth, clone_filter=options.clone_filter
+                    )
                 if (project.revision and not project.is_main) or branch:
                     git.checkout(revision=project.revision, branch=branch, force=force)
                 clone.check(exists=False)
@@ -621,10 +708,14 @@ class GitWS:
                 clone.git.commit(msg, paths=cpaths, all_=all_)
         else:
             # commit changed clones
+            clones = tuple(self.clones())
+            statuses = Git.status_many((clone.git for clone in clones), untracked=False)
             if all_:
-                clones = [clone for clone in self.clones() if clone.git.has_changes()]
+                clones = tuple(clone for clone in clones if any(status.has_changes() for status in statuses[clone.git]))
             else:
-                clones = [clone for clone in self.clones() if clone.git.has_index_changes()]
+                clones = tuple(
+                    clone for clone in clones if any(status.has_index_changes() for status in statuses[clone.git])
+                )
             for clone in clones:
                 self.secho(f"===== {clone.info} =====", fg=COLOR_BANNER)
                 clone.check()
@@ -668,6 +759,7 @@ class GitWS:
         project_paths: Optional[ProjectPaths] = None,
         reverse: bool = False,
         filter_=None,
+        jobs: Optional[int] = None,
     ):
         """
         Run ``command`` on each clone.
@@ -679,9 +771,49 @@ class GitWS:
             project_paths: Limit to projects only.
             reverse: Operate in reverse order.
             filter_: Filter Function
+            jobs: Run on up to ``jobs`` clones concurrently. The output is collected and reported in order.
+                  Commands, which are not started yet, are skipped after the first failure.
+                  One after another with direct output by default.
         """
-        for clone in self.foreach(project_paths=project_paths, reverse=reverse, filter_=filter_):
-            run(command, cwd=clone.git.path)
+        if jobs and jobs > 1:
+            self._run_foreach_concurrent(command, project_paths, reverse, filter_, jobs)
+        else:
+            for clone in self.foreach(project_paths=project_paths, reverse=reverse, filter_=filter_):
+                run(command, cwd=clone.git.path)
+
+    def _run_foreach_concurrent(
+        self, command, project_paths: Optional[ProjectPaths], reverse: bool, filter_, jobs: int
+    ):
+        # Just like one after another, ``command`` does not run beyond a missing clone
+        # and commands, which are not started yet, are skipped after the first failure.
+        # Commands start in order, so all skipped ones follow a failed one.
+        project_paths_filter = self._create_project_paths_filter(project_paths)
+        failed = Event()
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            runs = []
+            for clone in self.clones(resolve_url=True, reverse=reverse):
+                selected = project_paths_filter(clone.project) and (not filter_ or filter_(clone))
+                future = None
+                if selected and clone.git.is_cloned():
+                    future = executor.submit(_run_unless_failed, failed, command, clone.git.path)
+                runs.append((clone, selected, future))
+                if selected and not future:
+                    # clone.check() fails on it
+                    break
+            for clone, selected, future in runs:
+                if not selected:
+                    self.secho(f"===== SKIPPING {clone.info} =====", fg=COLOR_SKIP)
+                    continue
+                self.secho(f"===== {clone.info} =====", fg=COLOR_BANNER)
+                clone.check()
+                assert future
+                result = future.result()
+                assert result, "skipped command after failed one"
+                if result.stdout:
+                    self.secho(result.stdout.decode("utf-8", errors="replace").rstrip("\n"))
+                if result.stderr:
+                    self.secho(result.stderr.decode("utf-8", errors="replace").rstrip("\n"), err=True)
+                result.check_returncode()
 
     def foreach(
         self,
@@ -755,14 +887,14 @@ class GitWS:
         Yields:
             :any:`Project`
         """
-        workspace = self.workspace
-        manifest_path = self.manifest_path
-        group_filters = self.group_filters
-        yield from ProjectIter(
-            workspace,
+        yield from self._get_project_iter(skip_main=skip_main, resolve_url=resolve_url)
+
+    def _get_project_iter(self, skip_main: bool, resolve_url: bool) -> ProjectIter:
+        return ProjectIter(
+            self.workspace,
             self.manifest_format_manager,
-            manifest_path,
-            group_filters,
+            self.manifest_path,
+            self.group_filters,
             skip_main=skip_main,
             resolve_url=resolve_url,
         )
@@ -815,16 +947,23 @@ class GitWS:
             manifest_spec = manifest_spec.model_copy()
         if freeze:
             manifest = Manifest.from_spec(manifest_spec)
-            fdeps: List[ProjectSpec] = []
-            for project_spec, project in zip(manifest_spec.dependencies, manifest.dependencies):
-                project_path = workspace.get_project_path(project)
-                git = Git(resolve_relative(project_path), secho=self.secho)
-                git.check()
-                revision = git.get_sha()
-                fdeps.append(project_spec.model_copy(update={"revision": revision}))
-            manifest_spec = manifest_spec.model_copy(update={"dependencies": tuple(fdeps)})
+            projects = manifest.dependencies
+            # determine all revisions concurrently, but keep the order
+            with ThreadPoolExecutor(max_workers=get_max_workers(len(projects))) as executor:
+                revisions = executor.map(lambda project: self._get_frozen_revision(workspace, project), projects)
+                fdeps = tuple(
+                    project_spec.model_copy(update={"revision": revision})
+                    for project_spec, revision in zip(manifest_spec.dependencies, revisions)
+                )
+            manifest_spec = manifest_spec.model_copy(update={"dependencies": fdeps})
         return manifest_spec
 
+    def _get_frozen_revision(self, workspace: Workspace, project: Project) -> Optional[str]:
+        project_path = workspace.get_project_path(project)
+        git = Git(resolve_relative(project_path), secho=self.secho)
+        git.check()
+        return git.get_sha()
+
     def get_manifest(self, freeze: bool = False, resolve: bool = False) -> Manifest:
         """
         Get Manifest.
@@ -835,19 +974,31 @@ class GitWS:
             freeze: Determine current SHA of each project and use it as revision.
             resolve: Add project specification of all transient dependencies.
         """
-        manifest_path = self.workspace.get_manifest_path()
-        manifest_spec = self.get_manifest_spec(freeze=freeze, resolve=resolve)
-        return Manifest.from_spec(manifest_spec, path=str(manifest_path))
-
-    def get_deptree(self, primary=False) -> DepNode:
+        manifest_path = str(self.workspace.get_manifest_path())
+        if freeze or resolve:
+            manifest_spec = self.get_manifest_spec(freeze=freeze, resolve=resolve)
+            return Manifest.from_spec(manifest_spec, path=manifest_path)
+        # The manifest file is loaded from cache as long as it is unchanged - so the manifest is reused too
+        manifest_spec = self.manifest_format_manager.load(self.manifest_path)
+        cached = self.__manifest_cache
+        if cached and cached[0] is manifest_spec and cached[1] == manifest_path:
+            return cached[2]
+        manifest = Manifest.from_spec(manifest_spec, path=manifest_path)
+        self.__manifest_cache = (manifest_spec, manifest_path, manifest)
+        return manifest
+
+    def get_deptree(self, primary=False) -> "DepNode":
         """Get Dependency Tree."""
+        # anytree is just needed here - do not load it on every start
+        from ._deptree import get_deptree  # pylint: disable=import-outside-toplevel
+
         manifest = self.get_manifest()
         return get_deptree(self.workspace, self.manifest_format_manager, manifest, primary=primary)
 
     def _create_project_paths_filter(self, project_paths: Optional[ProjectPaths]):
         if project_paths:
             workspace = self.workspace
-            abspaths = [Path(project_path).resolve() for project_path in project_paths]
+            abspaths = frozenset(Path(project_path).resolve() for project_path in project_paths)
             return lambda project: workspace.get_project_path(project) in abspaths
 
         def default_filter(project: Project) -> bool:
@@ -932,3 +1083,97 @@ class GitWS:
             if project_update:
                 return project_spec.model_copy(update=project_update)
         return project_spec
+
+
+def _get_name(url: str) -> str:
+    """
+    Repository name of ``url``.
+
+    >>> _get_name("https://github.com/c0fec0de/git-ws.git")
+    'git-ws'
+    >>> _get_name("git@github.com:c0fec0de/git-ws")
+    'git-ws'
+    >>> _get_name("../git-ws.git/")
+    'git-ws'
+    """
+    mat = _RE_NAME.search(url)
+    return mat.group(1) if mat else ""
+
+
+def _get_status(git: Git, paths: Optional[Tuple[Path, ...]], branch: bool) -> List[Status]:
+    # missing clones are reported by `Clone.check()` in order - git would fall back to any surrounding repository
+    if not git.is_cloned():
+        return []
+    return list(git.status(paths=paths, branch=branch))
+
+
+def _get_diffstat(git: Git, paths: Optional[Tuple[Path, ...]]) -> List[DiffStat]:
+    # missing clones are reported by `Clone.check()` in order - git would fall back to any surrounding repository
+    if not git.is_cloned():
+        return []
+    return list(git.diffstat(paths=paths))
+
+
+def _run_unless_failed(failed: Event, command, cwd: Path) -> Optional[subprocess.CompletedProcess]:
+    """Run ``command`` capturing its output - unless ``failed`` is set already, which is set on failure."""
+    if failed.is_set():
+        return None
+    result = run(command, cwd=cwd, capture_output=True, check=False)
+    if result.returncode:
+        failed.set()
+    return result
+
+
+@contextmanager
+def _collect_logging(records: List[logging.LogRecord]):
+    """Collect the ``records`` logged by the current thread instead of emitting them."""
+    thread = get_ident()
+
+    def filter_(record: logging.LogRecord) -> bool:
+        if record.thread != thread:
+            return True
+        records.append(record)
+        return False
+
+    LOGGER.addFilter(filter_)
+    try:
+        yield
+    finally:
+        LOGGER.removeFilter(filter_)
+
+
+def _get_buffer_secho(outputs: List[Tuple[tuple, dict]]):
+    """:any:`click.secho` like print method, which collects all ``outputs`` instead."""
+
+    def secho(*args, **kwargs):
+        outputs.append((args, kwargs))
+
+    return secho
+
+
+def _flush_buffer_secho(secho, outputs: List[Tuple[tuple, dict]]):
+    """
+    Print ``outputs`` collected by :any:`_get_buffer_secho` via ``secho``.
+
+    Consecutive lines with the same style are joined to a single ``secho`` call.
+
+    >>> outputs = [(("a",), {}), (("b",), {}), (("c",), {"fg": "red"}), (("d",), {"err": True})]
+    >>> _flush_buffer_secho(lambda text, **kwargs: print(text.splitlines(), kwargs), outputs)
+    ['a', 'b'] {}
+    ['c'] {'fg': 'red'}
+    ['d'] {'err': True}
+    """
+    lines: List[str] = []
+    style: dict = {}
+    for args, kwargs in outputs:
+        joinable = len(args) == 1 and isinstance(args[0], str) and "nl" not in kwargs
+        if lines and (not joinable or kwargs != style):
+            secho("\n".join(lines), **style)
+            lines = []
+        if joinable:
+            lines.append(args[0])
+            style = kwargs
+        else:
+            secho(*args, **kwargs)
+    if lines:
+        secho("\n".join(lines), **style)
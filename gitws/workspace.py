@@ -21,16 +21,17 @@ The :any:`Workspace` class represents the location containing all git clones.
 :any:`Info` is a helper.
 """
 import logging
+import os
 import shutil
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Tuple
 
 import tomlkit
 from pydantic import Field
 
 from ._basemodel import BaseModel
-from ._util import resolve_relative
+from ._util import relative, resolve_relative
 from .appconfig import AppConfig, AppConfigData, AppConfigLocation
 from .const import GIT_WS_PATH, INFO_PATH, MANIFEST_PATH_DEFAULT
 from .datamodel import GroupFilters, Project, WorkspaceFileRefs
@@ -127,6 +128,7 @@ class Workspace:
         self.path = path
         self.info = info
         self.app_config = AppConfig(workspace_config_dir=str(path / GIT_WS_PATH))
+        self.__resolved: Optional[Tuple[str, Path, Path]] = None
 
     def __eq__(self, other):
         if isinstance(other, Workspace):
@@ -278,10 +280,18 @@ class Workspace:
         Keyword Args:
             relative: Return relative instead of absolute path.
         """
-        project_path = self.path / project.path
         if relative:
-            project_path = resolve_relative(project_path)
-        return project_path
+            return self._get_relative_project_path(project)
+        return self.path / project.path
+
+    def _get_relative_project_path(self, project: Project) -> Path:
+        """Project Path relative to the current working directory - cwd and root are resolved once per directory."""
+        cwd = os.getcwd()
+        resolved = self.__resolved
+        if resolved is None or resolved[0] != cwd:
+            resolved = self.__resolved = (cwd, Path(cwd).resolve(), self.path.resolve())
+        # project paths might be or contain symlinks - just the root is resolved already
+        return relative((resolved[2] / project.path).resolve(), resolved[1])
 
     def get_manifest_path(self, manifest_path: Optional[Path] = None) -> Path:
         """
@@ -77,6 +77,64 @@ def test_fetch(tmp_path, gws):
     _test_foreach(tmp_path, gws, "fetch")
 
 
+def test_fetch_jobs(tmp_path, gws):
+    """Test fetch --jobs."""
+    _test_foreach(tmp_path, gws, "fetch", "--jobs", "4")
+
+
+def test_foreach_jobs(tmp_path, gws):
+    """Test foreach --jobs - output is collected and reported in order."""
+    dep6_sha = Git(gws.path / "dep6").get_sha()
+    assert cli(["foreach", "--jobs", "4", "--", "git", "rev-parse", "--is-inside-work-tree"]) == [
+        "===== main (MAIN 'main', revision='main') =====",
+        "true",
+        "===== dep1 ('dep1') =====",
+        "WARNING: Clone dep1 has no revision!",
+        "true",
+        "===== dep2 ('dep2', revision='1-feature', submodules=False) =====",
+        "true",
+        "===== dep5 ('dep5', revision='final2') =====",
+        "true",
+        f"===== dep6 ('dep6', revision='{dep6_sha}') =====",
+        "true",
+        "===== dep4 ('dep4', revision='main') =====",
+        "true",
+        "",
+    ]
+
+
+def test_foreach_jobs_fail(tmp_path, gws):
+    """Test foreach --jobs failing - commands not started yet are skipped."""
+    # dep1 fails while main is still running, the next worker picks up dep2 after the failure
+    script = 'touch ran; case "$PWD" in */dep1) exit 1;; */main) sleep 2;; esac'
+    output = cli(["foreach", "--jobs", "2", "--", "sh", "-c", script], exit_code=1)
+    assert output[:3] == [
+        "===== main (MAIN 'main', revision='main') =====",
+        "===== dep1 ('dep1') =====",
+        "WARNING: Clone dep1 has no revision!",
+    ]
+    assert output[3].startswith("Error: 'sh -c ") and output[3].endswith(" failed.")
+    assert output[4:] == [""]
+    assert sorted(path.parent.name for path in (tmp_path / "main").glob("*/ran")) == ["dep1", "main"]
+
+
+def test_foreach_jobs_clone_missing(tmp_path, gws):
+    """Test foreach --jobs - nothing runs beyond a missing clone."""
+    rmtree(tmp_path / "main" / "dep2")
+    assert cli(["foreach", "--jobs", "4", "--", "touch", "ran"], exit_code=1) == [
+        "===== main (MAIN 'main', revision='main') =====",
+        "===== dep1 ('dep1') =====",
+        "WARNING: Clone dep1 has no revision!",
+        "===== dep2 ('dep2', revision='1-feature', submodules=False) =====",
+        "Error: Git Clone 'dep2' is missing. Try:",
+        "",
+        "    git ws update",
+        "",
+        "",
+    ]
+    assert sorted(path.parent.name for path in (tmp_path / "main").glob("*/ran")) == ["dep1", "main"]
+
+
 def test_rebase(tmp_path, gws):
     """Test rebase."""
     _test_foreach(tmp_path, gws, "rebase", on_branch=True)
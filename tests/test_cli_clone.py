@@ -90,7 +90,7 @@ def test_cli_clone_path(tmp_path, repos):
         check(workspace, "main", exists=False)
         check(workspace, "main2", content="main", depth=3, branches=3)
         check(workspace, "dep1", depth=2, branches=3)
-        check(workspace, "dep2", content="dep2-feature", depth=2, branches=5)
+        check(workspace, "dep2", content="dep2-feature", depth=2, branches=4)
         check(workspace, "dep3", exists=False)
         check(workspace, "dep4", depth=1, branches=4)
         check(workspace, "dep5", exists=False)
@@ -15,13 +15,17 @@
 # with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
 
 """Command Line Interface - Update Variants."""
+import os
+import subprocess
+import sys
 from pathlib import Path
+from unittest import mock
 
 from gitws import Git, GitWS, save
 from gitws.datamodel import ManifestSpec, ProjectSpec
 
 from .fixtures import create_repos
-from .util import chdir, check, cli, path2url, run
+from .util import chdir, check, cli, path2url, replace_path, run
 
 
 def test_update(tmp_path):
@@ -360,3 +364,94 @@ def test_update_missing_upstream(tmp_path):
         Git(gws.path / "dep4").checkout(branch="90-new")
 
         gws.update()
+
+
+def test_update_jobs(tmp_path):
+    """Concurrent update reports like a sequential one - on the file descriptors git writes to as well."""
+    repos_path = tmp_path / "repos"
+    create_repos(repos_path)
+    # dep5 is just known after dep4 is cloned
+    save(ManifestSpec(dependencies=[ProjectSpec(name="dep5", url="../dep5")]), repos_path / "dep4" / "git-ws.toml")
+    git4 = Git(repos_path / "dep4")
+    git4.add(paths=(Path("git-ws.toml"),))
+    git4.commit("adapt dep")
+
+    outputs = []
+    for name, options in (("seq", []), ("jobs", ["--jobs", "4"])):
+        (tmp_path / name).mkdir()
+        with chdir(tmp_path / name):
+            gws = GitWS.clone(path2url(repos_path / "main"))
+        outputs.append(_run_main(["update", *options], gws.path, repos_path))
+        outputs.append(_run_main(["update", "-P", "dep2", *options], gws.path, repos_path))
+        check(gws.path, "dep2", content="dep2-feature")
+        check(gws.path, "dep4")
+        check(gws.path, "dep5")
+    assert outputs[0][:4] == [
+        "===== main (MAIN 'main', revision='main') =====",
+        "Fetching.",
+        "Merging branch 'main'.",
+        "Already up to date.",
+    ]
+    assert outputs[0][-4:] == [
+        "===== dep5 ('dep5') =====",
+        "WARNING: Clone dep5 has no revision!",
+        "Cloning 'file://REPOS/dep5'.",
+        "Cloning into 'dep5'...",
+    ]
+    assert outputs[2:] == outputs[:2]
+
+
+def test_update_jobs_option(tmp_path):
+    """The ``jobs`` option makes updates concurrent by default - with the same output."""
+    repos_path = tmp_path / "repos"
+    create_repos(repos_path)
+
+    outputs = []
+    for name, env in (("seq", {}), ("jobs", {"GIT_WS_JOBS": "4"})):
+        (tmp_path / name).mkdir()
+        with chdir(tmp_path / name):
+            gws = GitWS.clone(path2url(repos_path / "main"))
+        outputs.append(_run_main(["update"], gws.path, repos_path, env=env))
+        outputs.append(_run_main(["update"], gws.path, repos_path, env=env))
+        with chdir(gws.path), mock.patch.dict(os.environ, env):
+            with mock.patch.object(GitWS, "_update_concurrent") as update_concurrent:
+                GitWS.from_path().update()
+            assert update_concurrent.called == bool(env)
+    assert "Already up to date." in outputs[1]
+    assert outputs[2:] == outputs[:2]
+
+
+def _run_main(args, cwd, repos_path, env=None):
+    """Run the command line interface in a subprocess and return its combined stdout and stderr lines."""
+    cmd = (sys.executable, "-m", "gitws", *args)
+    env = {**os.environ, **(env or {})}
+    result = run(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=True, env=env)
+    return replace_path(result.stdout.decode("utf-8"), repos_path, "REPOS").splitlines()
+
+
+def test_update_jobs_fail(tmp_path):
+    """Concurrent update stops like a sequential one - and reports updates, which ran concurrently."""
+    repos_path = tmp_path / "repos"
+    create_repos(repos_path)
+    with chdir(tmp_path):
+        gws = GitWS.clone(path2url(repos_path / "main"))
+        gws.update()
+    run(("git", "remote", "set-url", "origin", str(tmp_path / "missing")), cwd=gws.path / "dep1", check=True)
+
+    with chdir(gws.path):
+        jobs = cli(["update", "--jobs", "4"], exit_code=1, tmp_path=tmp_path, repos_path=repos_path)
+        seq = cli(["update"], exit_code=1, tmp_path=tmp_path, repos_path=repos_path)
+    # git writes to the file descriptor on a sequential update, which cli() does not capture
+    jobs = [line for line in jobs if line != "Already up to date."]
+    assert seq[-2:] == ["Error: 'git fetch' failed.", ""]
+    assert jobs[: len(seq) - 2] == seq[:-2]
+    assert jobs[-2:] == seq[-2:]
+    # dep2 is updated concurrently to dep1 unless dep1 failed before - dep4 of dep1's manifest is never reached
+    assert jobs[len(seq) - 2 : -2] in (
+        [],
+        [
+            "===== dep2 ('dep2', revision='1-feature', submodules=False) =====",
+            "Fetching.",
+            "Merging branch '1-feature'.",
+        ],
+    )
@@ -22,7 +22,19 @@ from unittest import mock
 
 from pytest import raises
 
-from gitws import Clone, Git, GitCloneNotCleanError, GitWS, Manifest, NotEmptyError, Project, WorkspaceNotEmptyError
+from gitws import (
+    AppConfig,
+    AppConfigLocation,
+    Clone,
+    Git,
+    GitCloneNotCleanError,
+    GitWS,
+    Manifest,
+    NotEmptyError,
+    Project,
+    WorkspaceNotEmptyError,
+)
+from gitws.appconfig import clear_clone_cache, get_clone_cache
 
 from .util import chdir, check, path2url
 
@@ -332,3 +344,23 @@ def test_clone_force(tmp_path, repos):
         check(workspace, "dep3", exists=False)
         check(workspace, "dep4")
         check(workspace, "dep5", exists=False)
+
+
+def test_clone_cache_option(tmp_path):
+    """``get_clone_cache`` follows the environment and configuration files."""
+    env = {"GIT_WS_CONFIG_USER_DIR": str(tmp_path / "user"), "GIT_WS_CONFIG_SYSTEM_DIR": str(tmp_path / "system")}
+    with mock.patch.dict(os.environ, env):
+        os.environ.pop("GIT_WS_CLONE_CACHE", None)
+        clear_clone_cache()
+        assert get_clone_cache() is None
+        (tmp_path / "user").mkdir()
+        (tmp_path / "user" / "config.toml").write_text(f'clone_cache = "{tmp_path / "user-cache"}"\n')
+        assert get_clone_cache() == tmp_path / "user-cache"
+        with AppConfig().edit(AppConfigLocation.SYSTEM) as config:
+            config.clone_cache = str(tmp_path / "system-cache")
+        assert get_clone_cache() == tmp_path / "user-cache"
+        with mock.patch.dict(os.environ, {"GIT_WS_CLONE_CACHE": str(tmp_path / "env-cache")}):
+            assert get_clone_cache() == tmp_path / "env-cache"
+        assert get_clone_cache() == tmp_path / "user-cache"
+        (tmp_path / "user" / "config.toml").unlink()
+        assert get_clone_cache() == tmp_path / "system-cache"
@@ -15,13 +15,17 @@
 # with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
 
 """Git Testing."""
+import hashlib
 import re
+import shutil
 from pathlib import Path
+from subprocess import CalledProcessError
 
-from pytest import fixture
+from pydantic import ValidationError
+from pytest import fixture, raises
 
 from gitws._util import run
-from gitws.git import Git
+from gitws.git import DiffStat, FileStatus, Git, State
 
 from .fixtures import git_repo
 from .util import path2url
@@ -55,6 +59,9 @@ def test_git(git):
     assert git.is_cloned()
     assert git.get_url() is None
     path = git.path
+    (path / "sub").mkdir()
+    assert not Git(path / "sub").is_cloned()
+    assert not Git(path / ".git").is_cloned()
 
     (path / "data.txt").touch()
     git.add(("data.txt",))
@@ -221,6 +228,21 @@ def test_git_has_changes(tmp_path, repos):
     assert not git.is_empty()
 
 
+def test_git_has_changes_unborn(tmp_path):
+    """Git Has Changes without any commit and outside of a clone."""
+    git = Git.init(tmp_path / "main")
+    assert not git.has_changes()
+
+    (git.path / "new.txt").touch()
+    git.add(("new.txt",))
+    assert git.has_index_changes()
+    assert not git.has_work_changes()
+
+    other = Git(tmp_path)
+    with raises(CalledProcessError):
+        other.has_changes()
+
+
 def test_git_empty(git):
     """Git Has Changes."""
     path = git.path
@@ -260,6 +282,13 @@ def test_git_empty_stash(tmp_path, git):
 
     assert not clone.is_empty()
 
+    run(("git", "pack-refs", "--all"), cwd=clone_path)
+    assert not (clone_path / ".git" / "refs" / "stash").exists()
+    assert not clone.is_empty()
+
+    run(("git", "stash", "drop"), cwd=clone_path)
+    assert clone.is_empty()
+
 
 def test_cache_modified(tmp_path, repos):
     """Broken cache."""
@@ -272,8 +301,16 @@ def test_cache_modified(tmp_path, repos):
     git.checkout("1-feature")
     assert (git.path / "data.txt").read_text() == "dep2-feature"
 
-    # corrupt cache
+    # objects are shared with the cache
     cache_entry_path = next(iter(cache_path.glob("*")))
+    cache_objects = cache_entry_path / ".git" / "objects"
+    cache_object = next(path for path in cache_objects.rglob("*") if path.is_file())
+    clone_object = git.path / ".git" / "objects" / cache_object.relative_to(cache_objects)
+    assert clone_object.stat().st_ino == cache_object.stat().st_ino
+    # but the work tree is a copy (or a copy-on-write clone)
+    assert (git.path / "data.txt").stat().st_ino != (cache_entry_path / "data.txt").stat().st_ino
+
+    # corrupt cache
     (cache_entry_path / "data.txt").write_text("dep2-feature*")
     (cache_entry_path / "new.txt").touch()
 
@@ -318,3 +355,218 @@ def test_cache_nomain(tmp_path):
     assert (git.path / "data.txt").read_text() == "main"
 
     assert marker_filepath.exists()
+
+
+def test_git_cache(git):
+    """Cached Queries Notice External Changes."""
+    path = git.path
+    sha = git.get_sha()
+    assert git.get_branch() == "main"
+    assert git.get_tag() is None
+    assert git.get_url() is None
+
+    run(("git", "checkout", "-b", "other"), cwd=path)
+    assert git.get_branch() == "other"
+    assert git.get_sha() == sha
+
+    run(("git", "tag", "mytag"), cwd=path)
+    assert git.get_tag() == "mytag"
+
+    (path / "data.txt").touch()
+    run(("git", "add", "data.txt"), cwd=path)
+    run(("git", "commit", "-m", "data"), cwd=path)
+    assert git.get_sha() != sha
+    assert git.get_tag() is None
+
+    # nested tags
+    run(("git", "tag", "release/v0", sha), cwd=path)
+    assert git.get_tag() is None
+    run(("git", "tag", "release/v1"), cwd=path)
+    assert git.get_tag() == "release/v1"
+    assert git.describe_head()[0] == "release/v1"
+    run(("git", "tag", "--delete", "release/v1"), cwd=path)
+    assert git.get_tag() is None
+
+    run(("git", "remote", "add", "origin", "https://example.com/repo.git"), cwd=path)
+    assert git.get_url() == "https://example.com/repo.git"
+
+    assert git.get_upstream_branch() is None
+    run(("git", "update-ref", "refs/remotes/origin/other", "HEAD"), cwd=path)
+    run(("git", "branch", "--set-upstream-to=origin/other"), cwd=path)
+    assert git.get_upstream_branch() == "origin/other"
+
+    assert git.is_cloned()
+    shutil.rmtree(path / ".git")
+    assert not git.is_cloned()
+
+
+def test_git_status_rename(git):
+    """Git Status On Renamed And Spaced Files."""
+    path = git.path
+
+    (path / "my data.txt").touch()
+    git.add(("my data.txt",))
+    git.commit("data")
+    run(("git", "mv", "my data.txt", "moved data.txt"), cwd=path)
+
+    assert [str(item) for item in git.status()] == ["R  my data.txt -> moved data.txt"]
+    assert [str(item) for item in git.status(branch=True)] == ["## main", "R  my data.txt -> moved data.txt"]
+
+    (path / "new\nline.txt").touch()
+    assert [item.path for item in git.status()] == [Path("moved data.txt"), Path("new\nline.txt")]
+
+
+def test_git_status_many(tmp_path, git):
+    """Git Status On Multiple Clones."""
+    other = Git.init(tmp_path / "other")
+    (git.path / "data.txt").touch()
+    (other.path / "other.txt").touch()
+    (other.path / "more.txt").touch()
+
+    statuses = Git.status_many((git, other))
+    assert [str(item) for item in statuses[git]] == ["?? data.txt"]
+    assert [str(item) for item in statuses[other]] == ["?? more.txt", "?? other.txt"]
+    assert Git.status_many((git, other), untracked=False) == {git: [], other: []}
+    assert Git.status_many(()) == {}
+
+    with raises(CalledProcessError):
+        Git.status_many((Git(tmp_path),))
+
+
+def test_git_resolve(tmp_path, git):
+    """Resolve Revisions."""
+    sha = git.get_sha()
+    assert is_sha(sha)
+    with git:
+        assert git.get_sha("main") == sha
+        assert git.get_sha("HEAD") == sha
+        assert git.get_sha("unknown") is None
+        assert git.get_sha("main\nHEAD") is None
+    git.close()
+    assert git.get_sha("main") == sha
+
+    empty = Git.init(tmp_path / "empty")
+    assert empty.get_sha() is None
+
+    nogit = Git(tmp_path / "nogit")
+    nogit.path.mkdir()
+    assert nogit.get_sha("main") is None
+
+
+def test_git_revision_tags(git):
+    """Revision With Multiple Tags."""
+    assert git.get_revision() == "main"
+    git.tag("one")
+    git.tag("two")
+    tag, branch, sha = git.describe_head()
+    assert tag in ("one", "two")
+    assert branch == "main"
+    assert sha == git.get_sha()
+    assert git.describe_head() == (tag, branch, sha)
+    run(("git", "checkout", "--detach"), cwd=git.path)
+    assert git.get_revision() in ("one", "two")
+    assert git.get_branch() is None
+    assert git.get_tag() in ("one", "two")
+
+
+def test_git_clone_revision(tmp_path, git, capfd):
+    """Clone With Revision."""
+    sha = git.get_sha()
+    git.tag("v1")
+    run(("git", "branch", "other"), cwd=git.path)
+    url = path2url(git.path)
+
+    for idx, (revision, expected) in enumerate((("other", "other"), ("v1", "v1"), (sha, "v1"), ("main~0", "v1"))):
+        clone = Git(tmp_path / f"clone{idx}")
+        clone.clone(url, revision=revision)
+        assert clone.get_revision() == expected
+        assert clone.get_sha() == sha
+    # the failed 'git clone --branch' attempt on 'main~0' is not reported
+    assert "fatal" not in capfd.readouterr().err
+
+
+def test_git_clone_filter(tmp_path, git):
+    """Partial Clone."""
+    git.set_config("uploadpack.allowFilter", "true")
+    url = path2url(git.path)
+
+    for idx, (revision, depth) in enumerate(((None, None), ("main", None), (None, 1), ("main", 1))):
+        clone = Git(tmp_path / f"clone{idx}")
+        clone.clone(url, revision=revision, depth=depth, clone_filter="blob:none")
+        assert clone.get_sha() == git.get_sha()
+        assert (clone.path / "file.txt").exists()
+        promisor = run(("git", "config", "remote.origin.promisor"), cwd=clone.path, capture_output=True)
+        assert promisor.stdout == b"true\n"
+
+
+def test_git_diffstat(git):
+    """Diff Statistics."""
+    (git.path / "file.txt").write_text("line\n")
+    (git.path / "new.txt").touch()
+    git.add(("new.txt",))
+    assert [str(item) for item in git.diffstat()] == [" file.txt | 1 +"]
+    assert not git.is_empty()
+
+
+def test_cache_legacy_key(tmp_path, repos):
+    """Clone Cache Entries Named By SHA256 Are Taken Over."""
+    cache_path = tmp_path / "cache"
+    repo = (repos / "dep2").resolve()
+
+    git = Git(tmp_path / "main1", clone_cache=cache_path)
+    git.clone(str(repo))
+    cache_entry_path = next(iter(cache_path.glob("*")))
+    legacy_path = cache_path / hashlib.sha256(str(repo).encode("utf-8")).hexdigest()
+    cache_entry_path.rename(legacy_path)
+
+    git = Git(tmp_path / "main2", clone_cache=cache_path)
+    git.clone(str(repo))
+    assert not legacy_path.exists()
+    assert cache_entry_path.exists()
+
+
+def test_status_validation():
+    """Parsers skip validation, but the public constructors still validate."""
+    assert FileStatus(index="M", work=" ", path="file.txt") == FileStatus.from_str("M  file.txt")
+    assert FileStatus(index="M", work=" ", path="file.txt").index is State.MODIFIED
+    with raises(ValidationError):
+        FileStatus(index="X", work=" ", path="file.txt")
+    with raises(ValidationError):
+        FileStatus(index="M", work=" ")
+    assert DiffStat(path="file.txt", stat="1 +") == DiffStat.from_str(" file.txt | 1 +")
+    with raises(ValidationError):
+        DiffStat(path="file.txt")
+
+
+def test_git_head_sha(tmp_path, git):
+    """``get_sha()`` reads ``HEAD`` from the filesystem, just like ``git rev-parse HEAD``."""
+
+    def rev_parse():
+        return run(("git", "rev-parse", "HEAD"), cwd=git.path, capture_output=True).stdout.decode("utf-8").strip()
+
+    assert git._read_head_sha() == rev_parse()
+    run(("git", "pack-refs", "--all"), cwd=git.path)
+    assert not (git.path / ".git" / "refs" / "heads" / "main").exists()
+    assert git._read_head_sha() == rev_parse()
+    assert git.get_sha() == rev_parse()
+    git.checkout(rev_parse())
+    assert git._read_head_sha() == rev_parse()
+
+    unborn = Git.init(tmp_path / "unborn")
+    assert unborn._read_head_sha() is None
+    assert unborn.get_sha() is None
+    assert Git(tmp_path / "missing")._read_head_sha() is None
+
+
+def test_git_head_branch(tmp_path, git):
+    """``get_branch()`` reads ``HEAD`` from the filesystem, just like ``git branch``."""
+    assert git._read_head_branch() == "main"
+    run(("git", "pack-refs", "--all"), cwd=git.path)
+    assert git._read_head_branch() == "main"
+    git.checkout(git.get_sha())
+    assert git._read_head_branch() is None
+    assert git.get_branch() is None
+
+    unborn = Git.init(tmp_path / "unborn")
+    assert unborn._read_head_branch() is None
+    assert unborn.get_branch() is None
@@ -39,6 +39,7 @@ def test_empty_project_iter(tmp_path, mngr):
     group_filters: GroupFilters = []
     project_iter = ProjectIter(workspace, mngr, manifest_path, group_filters)
     assert tuple(project_iter) == ()
+    assert tuple(project_iter.batches()) == ()
 
 
 def test_empty_manifest_iter(tmp_path, mngr):
@@ -16,11 +16,12 @@
 
 """Manifest Format Manager Testing."""
 
+import os
 from pathlib import Path
 
 from pytest import raises
 
-from gitws import IncompatibleFormatError, ManifestFormat
+from gitws import IncompatibleFormatError, ManifestFormat, ManifestNotFoundError, ManifestSpec, ProjectSpec
 from gitws._manifestformatmanager import ManifestFormatManager
 
 
@@ -109,3 +110,34 @@ def test_load_plugins():
     mngr = ManifestFormatManager()
     mngr.load_plugins()
     assert any(format.__class__ for format in mngr.manifest_formats)
+
+
+def test_load_cache(tmp_path):
+    """Unchanged Manifests Are Loaded Once."""
+    mngr = ManifestFormatManager()
+    mngr.load_plugins()
+    filepath = tmp_path / "manifest.toml"
+    with raises(ManifestNotFoundError):
+        mngr.load(filepath)
+
+    with mngr.handle(filepath) as handler:
+        handler.save(ManifestSpec(dependencies=[ProjectSpec(name="dep1")]))
+    # recently modified files are not cached
+    first = mngr.load(filepath)
+    assert mngr.load(filepath) is not first
+    assert mngr.load(filepath) == first
+
+    os.utime(filepath, ns=(0, 0))
+    first = mngr.load(filepath)
+    assert mngr.load(filepath) is first
+
+    with mngr.handle(filepath) as handler:
+        handler.save(ManifestSpec(dependencies=[ProjectSpec(name="dep2")]))
+    os.utime(filepath, ns=(1, 1))
+    second = mngr.load(filepath)
+    assert second is not first
+    assert [dep.name for dep in second.dependencies] == ["dep2"]
+
+    filepath.unlink()
+    with raises(ManifestNotFoundError):
+        mngr.load(filepath)
@@ -16,6 +16,7 @@
 
 """Utility Testing."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from time import sleep
@@ -32,6 +33,23 @@ def test_path_lock():
             path.write_text("Hello World!", encoding="utf-8")
 
 
+def test_path_lock_threads():
+    """Threads locking the same path wait for each other."""
+    with TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "counter.txt"
+        path.write_text("0", encoding="utf-8")
+
+        def increment(_):
+            with path_lock(path):
+                value = int(path.read_text(encoding="utf-8"))
+                sleep(0.1)
+                path.write_text(str(value + 1), encoding="utf-8")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            tuple(executor.map(increment, range(4)))
+        assert path.read_text(encoding="utf-8") == "4"
+
+
 def test_atomic_updates_on_file():
     """Test if atomic file updates work."""
     with TemporaryDirectory() as tmp_dir:
@@ -15,8 +15,13 @@
 # with Git Workspace. If not, see <https://www.gnu.org/licenses/>.
 
 """Utility Testing."""
+import subprocess
+import time
+from contextlib import closing
 
-from gitws._util import no_echo
+from pytest import raises
+
+from gitws._util import is_empty_or_missing, no_echo, rmtree, run_stream
 
 
 def test_no_echo(capsys):
@@ -27,3 +32,51 @@ def test_no_echo(capsys):
     captured = capsys.readouterr()
     assert captured.out == ""
     assert captured.err == "err\n"
+
+
+def test_run_stream(tmp_path):
+    """Test ``run_stream`` function."""
+    assert list(run_stream(("printf", "a\\0b\\0c"))) == [b"a", b"b", b"c"]
+    assert list(run_stream(("printf", "a\\0b\\0"))) == [b"a", b"b"]
+    assert list(run_stream(("printf", "a\\nb"), sep=b"\n")) == [b"a", b"b"]
+
+    with raises(subprocess.CalledProcessError):
+        list(run_stream(("git", "status", "--porcelain", "-z"), cwd=tmp_path))
+
+
+def test_run_stream_stop():
+    """``run_stream`` terminates the command, if the iteration stops early."""
+    timeout = 30
+    start = time.monotonic()
+    with closing(run_stream(("sh", "-c", "printf 'a\\0'; exec sleep 60"))) as records:
+        assert next(records) == b"a"
+    assert time.monotonic() - start < timeout
+
+
+def test_run_stream_stderr():
+    """``run_stream`` does not block on a command writing a lot to stderr first."""
+    # ``timeout`` fails the command instead of hanging the test
+    cmd = ("timeout", "30", "sh", "-c", "head -c 1000000 /dev/zero >&2; printf 'a\\0b'")
+    assert list(run_stream(cmd)) == [b"a", b"b"]
+
+
+def test_is_empty_or_missing(tmp_path):
+    """Test ``is_empty_or_missing`` function."""
+    path = tmp_path / "dir"
+    assert is_empty_or_missing(path)
+    path.mkdir()
+    assert is_empty_or_missing(path)
+    (path / "file.txt").touch()
+    assert not is_empty_or_missing(path)
+
+
+def test_rmtree(tmp_path):
+    """Test ``rmtree`` function."""
+    path = tmp_path / "dir"
+    (path / "sub").mkdir(parents=True)
+    (path / "sub" / "file.txt").touch()
+    rmtree(path)
+    assert not path.exists()
+    assert tmp_path.exists()
+    # missing directory is ignored
+    rmtree(path)
@@ -21,7 +21,7 @@ from pytest import raises
 
 from gitws import InitializedError, OutsideWorkspaceError, UninitializedError
 from gitws.const import CONFIG_PATH, INFO_PATH
-from gitws.datamodel import WorkspaceFileRef
+from gitws.datamodel import Project, WorkspaceFileRef
 from gitws.workspace import Info, Workspace
 
 from .common import TESTDATA_PATH
@@ -68,6 +68,22 @@ def test_init(tmp_path):
             Workspace.init(tmp_path, main_path=main_path)
 
 
+def test_project_path(tmp_path):
+    """Relative project paths follow symlinks like resolved ones."""
+    (tmp_path / "main").mkdir()
+    (tmp_path / "elsewhere" / "dep1").mkdir(parents=True)
+    (tmp_path / "main" / "dep1").symlink_to(tmp_path / "elsewhere" / "dep1")
+    workspace = Workspace.init(tmp_path / "main", main_path=tmp_path / "main")
+    project = Project(name="dep1", path="dep1")
+    with chdir(tmp_path / "main"):
+        assert workspace.get_project_path(project) == tmp_path / "main" / "dep1"
+        assert workspace.get_project_path(project, relative=True) == Path("..") / "elsewhere" / "dep1"
+    with chdir(tmp_path / "elsewhere" / "dep1"):
+        assert workspace.get_project_path(project, relative=True) == Path(".")
+    with chdir(tmp_path / "main" / "dep1"):
+        assert workspace.get_project_path(project, relative=True) == Path(".")
+
+
 def test_outside(tmp_path):
     """Test Outside."""
     with chdir(tmp_path):